@@ -4,21 +4,27 @@ Interactive dashboard for market participants using Azure AI Agent Service with
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+import numpy as np
 import json
 import asyncio
+import functools
 import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
 import re
 from datetime import datetime, timedelta, date
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 import sys
 import os
 import tempfile
 import subprocess
 from dotenv import load_dotenv
-import ast
+
+# pandas and plotly are imported where first used to keep session cold-start light
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Load environment variables
 load_dotenv(".env", override=True)
@@ -43,7 +49,10 @@ try:
         FunctionTool,
         ToolSet,
         ThreadMessage,
-        MessageRole
+        MessageRole,
+        MessageDeltaChunk,
+        ThreadRun,
+        AgentStreamEvent
     )
     from azure.identity import DefaultAzureCredential
     from azure.core.credentials import AzureKeyCredential
@@ -53,10 +62,26 @@ except ImportError:
     USE_AZURE_AI = False
     st.warning("Azure AI Project SDK not available. Using fallback mode.")
 
+# Fast JSON parsing for MCP payloads
+try:
+    import orjson
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
+
+# Arrow-backed DataFrame construction for analytics (ships with streamlit)
+try:
+    import pyarrow as pa
+    USE_PYARROW = True
+except ImportError:
+    USE_PYARROW = False
+
 # MCP Client imports for agent tool registration
 try:
+    import httpx
     from mcp import ClientSession
     from mcp.client.streamable_http import streamablehttp_client
+    from mcp.types import TextContent
     USE_MCP = True
 except ImportError:
     USE_MCP = False
@@ -100,6 +125,110 @@ MCP_SERVERS = {
     "websearch": "http://localhost:8001/mcp"
 }
 
+# Keywords that route a message to MCP tools or flag it for visualization
+CORPORATE_ACTION_KEYWORDS = frozenset({
+    "corporate actions", "dividend", "split", "merger", "acquisition",
+    "recent", "latest", "summary", "events", "stock split", "spinoff"
+})
+NEWS_KEYWORDS = frozenset({
+    "news", "market", "financial news", "announcements", "press release"
+})
+VISUALIZATION_KEYWORDS = frozenset({
+    "chart", "graph", "plot", "visualize", "visualization", "show", "display",
+    "pie chart", "bar chart", "timeline", "dashboard", "metrics"
+})
+
+# Precompiled patterns for pulling companies and symbols out of responses
+COMPANY_PATTERNS = [
+    (re.compile(pattern), pattern.replace(r'\s+', ' ').title())
+    for pattern in [
+        r'apple\s+inc', r'microsoft\s+corp', r'tesla\s+inc',
+        r'alphabet\s+inc', r'nvidia\s+corp', r'amazon\s+com',
+        r'meta\s+platforms', r'google', r'apple', r'microsoft',
+        r'tesla', r'nvidia', r'amazon', r'meta'
+    ]
+]
+SYMBOL_PATTERN = re.compile(r'([A-Z]{2,5})')
+
+@functools.lru_cache(maxsize=1024)
+def detect_visualization_request(message_lower: str) -> bool:
+    """Detect if a lowercased message requests visualization"""
+    return any(keyword in message_lower for keyword in VISUALIZATION_KEYWORDS)
+
+# Queries prefetched in one batch once the agent is ready
+ANALYTICS_MCP_QUERY = "Get comprehensive corporate actions data for advanced analytics and trend analysis"
+PREFETCH_MCP_QUERIES = [ANALYTICS_MCP_QUERY]
+# Seconds a page waits for a still-running prefetch before fetching directly
+PREFETCH_WAIT_TIMEOUT = 30
+
+# Argument builders for tools called directly by _try_mcp_tools_first
+MCP_TOOL_ARG_BUILDERS = {
+    "rag_query": lambda message: {"query": message, "max_results": 5, "chat_history": ""},
+    "search_corporate_actions": lambda message: {"search_text": message, "limit": 10},
+    "web_search": lambda message: {"query": message, "max_results": 5},
+    "news_search": lambda message: {"query": message, "max_results": 5}
+}
+
+def default_mcp_tool_args(message: str) -> Dict:
+    """Arguments for MCP tools without a dedicated builder"""
+    return {"query": message}
+
+def search_filter_args(filters: Dict) -> Dict:
+    """Map Search page filters onto search_corporate_actions arguments"""
+    args = {}
+    search_text = " ".join(v for v in (filters.get("search_text"), filters.get("company_name")) if v)
+    if search_text:
+        args["search_text"] = search_text
+    if filters.get("event_type"):
+        args["event_types"] = filters["event_type"]
+    if filters.get("status"):
+        args["status_filter"] = filters["status"]
+    if filters.get("limit"):
+        args["limit"] = filters["limit"]
+    return args
+
+# Inquiry card accent colors by priority and status
+INQUIRY_PRIORITY_COLORS = {
+    "LOW": "#28a745",
+    "MEDIUM": "#ffc107",
+    "HIGH": "#fd7e14",
+    "URGENT": "#dc3545"
+}
+INQUIRY_STATUS_COLORS = {
+    "OPEN": "#17a2b8",
+    "ACKNOWLEDGED": "#6c757d",
+    "IN_REVIEW": "#007bff",
+    "RESPONDED": "#28a745",
+    "ESCALATED": "#dc3545",
+    "RESOLVED": "#20c997",
+    "CLOSED": "#6c757d"
+}
+
+# Discovered MCP tool schemas are cached on disk between app restarts
+MCP_TOOL_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "corpact", "mcp_tools.json")
+MCP_TOOL_CACHE_TTL = 3600  # seconds
+
+# Keep-alive pool shared by every MCP session the agent manager opens
+MCP_HTTP_LIMITS = {
+    "max_keepalive_connections": 32,
+    "max_connections": 64,
+    "keepalive_expiry": 300
+}
+
+if USE_MCP:
+    class PooledMCPTransport(httpx.AsyncBaseTransport):
+        """Forward MCP session requests to a shared connection pool that outlives the session"""
+        
+        def __init__(self, transport: httpx.AsyncBaseTransport):
+            self.transport = transport
+        
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            return await self.transport.handle_async_request(request)
+        
+        async def aclose(self) -> None:
+            # streamablehttp_client closes its client after every session; keep the pool open
+            pass
+
 class AzureAIAgentManager:
     """Azure AI Agent Service manager with MCP tool integration"""
     
@@ -110,6 +239,52 @@ class AzureAIAgentManager:
         self.thread = None
         self.mcp_tools = {}
         self.is_initialized = False
+        self._http = weakref.WeakKeyDictionary()
+        self._mcp_inflight: Dict[str, asyncio.Future] = {}
+    
+    def _log(self, level: str, msg: str):
+        """Queue a sidebar status message for the browser session that triggered it"""
+        # The manager is shared by every session, so messages are queued in the caller's session state;
+        # background threads such as the MCP prefetch belong to no session and only print
+        if get_script_run_ctx() is None:
+            print(f"{level.upper()} - {msg}")
+            return
+        st.session_state.setdefault("status_log", []).append((level, msg))
+    
+    @staticmethod
+    def render_status_log():
+        """Render this session's queued status messages in the sidebar and clear its queue"""
+        for level, msg in st.session_state.pop("status_log", []):
+            getattr(st.sidebar, level)(msg)
+    
+    def _get_http_transport(self):
+        """Get the pooled HTTP/2 transport for the running event loop"""
+        loop = asyncio.get_running_loop()
+        # Pooled connections are bound to the loop that opened them, so keep one pool per loop
+        transport = self._http.get(loop)
+        if transport is None:
+            transport = PooledMCPTransport(httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(**MCP_HTTP_LIMITS)
+            ))
+            self._http[loop] = transport
+        return transport
+    
+    def _http_client_factory(self, headers=None, timeout=None, auth=None):
+        """Build the httpx client used by streamablehttp_client on top of the shared pool"""
+        return httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout if timeout is not None else httpx.Timeout(30.0),
+            auth=auth,
+            follow_redirects=True,
+            transport=self._get_http_transport()
+        )
+    
+    async def close(self):
+        """Close pooled MCP HTTP connections for the running event loop"""
+        transport = self._http.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.transport.aclose()
     
     async def initialize(self):
         """Initialize Azure AI Agent Service with MCP tool discovery"""        
@@ -126,7 +301,7 @@ class AzureAIAgentManager:
             if not endpoint.startswith("https://"):
                 endpoint = f"https://{endpoint}"
             
-            st.sidebar.info(f"🔗 Connecting to Azure AI Project: {endpoint}")            # Initialize Azure AI Project Client exactly as shown in quickstart documentation
+            self._log("info", f"🔗 Connecting to Azure AI Project: {endpoint}")            # Initialize Azure AI Project Client exactly as shown in quickstart documentation
             # Reference: https://learn.microsoft.com/en-us/azure/ai-services/agents/quickstart?pivots=programming-language-python-azure
             self.project_client = AIProjectClient(
                 endpoint=endpoint,
@@ -137,7 +312,7 @@ class AzureAIAgentManager:
             # Get the agents client from the project client
             self.client = self.project_client.agents
             
-            st.sidebar.success(f"✅ Connected to Azure AI Project")
+            self._log("success", f"✅ Connected to Azure AI Project")
             
             # Discover and register MCP tools
             await self._discover_mcp_tools()
@@ -153,39 +328,90 @@ class AzureAIAgentManager:
             return False
             return False
     
+    async def _list_server_tools(self, server_url: str) -> List[Dict]:
+        """Initialize a session with one MCP server and list its tools"""
+        async with streamablehttp_client(server_url, httpx_client_factory=self._http_client_factory) as (read_stream, write_stream, _):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                
+                # List available tools
+                tools_result = await session.list_tools()
+                return [
+                    {"name": tool.name, "description": tool.description, "inputSchema": tool.inputSchema}
+                    for tool in tools_result.tools
+                ]
+    
+    def _load_cached_mcp_tools(self) -> Dict[str, Dict]:
+        """Load cached tool schema entries that are still fresh, keyed by server name"""
+        try:
+            with open(MCP_TOOL_CACHE_PATH, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        # Each server's entry ages from its own fetch; only reuse it while the URL is unchanged
+        now = datetime.now().timestamp()
+        return {
+            server_name: entry
+            for server_name, entry in cached.items()
+            if MCP_SERVERS.get(server_name) == entry.get("server_url")
+            and now - entry.get("fetched_at", 0) <= MCP_TOOL_CACHE_TTL
+        }
+    
+    def _save_cached_mcp_tools(self, entries: Dict[str, Dict]):
+        """Persist discovered tool schema entries so the next start can skip discovery"""
+        try:
+            os.makedirs(os.path.dirname(MCP_TOOL_CACHE_PATH), exist_ok=True)
+            with open(MCP_TOOL_CACHE_PATH, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+        except OSError as e:
+            self._log("warning", f"⚠️ Could not cache MCP tools: {str(e)}")
+    
     async def _discover_mcp_tools(self):
         """Discover available tools from MCP servers and register them as Azure AI functions"""
         if not USE_MCP:
             return
-            
-        for server_name, server_url in MCP_SERVERS.items():
-            try:
-                async with streamablehttp_client(server_url) as (read_stream, write_stream, _):
-                    async with ClientSession(read_stream, write_stream) as session:
-                        await session.initialize()
-                        
-                        # List available tools
-                        tools_result = await session.list_tools()
-                        
-                        for tool in tools_result.tools:
-                            # Create Azure AI function from MCP tool
-                            function_def = {
-                                "name": f"mcp_{server_name}_{tool.name}",
-                                "description": tool.description or f"MCP tool: {tool.name}",
-                                "parameters": self._convert_mcp_schema_to_openai(tool.inputSchema)
-                            }
-                            
-                            # Store MCP tool info for execution
-                            self.mcp_tools[function_def["name"]] = {
-                                "server_url": server_url,
-                                "tool_name": tool.name,
-                                "schema": tool.inputSchema
-                            }
-                            
-                            st.sidebar.success(f"✅ Registered MCP tool: {tool.name} from {server_name}")
-                            
-            except Exception as e:
-                st.sidebar.warning(f"⚠️ Failed to connect to {server_name}: {str(e)}")
+        
+        entries = self._load_cached_mcp_tools()
+        pending = [(name, url) for name, url in MCP_SERVERS.items() if name not in entries]
+        
+        # Query all uncached servers concurrently
+        results = await asyncio.gather(
+            *(self._list_server_tools(server_url) for _, server_url in pending),
+            return_exceptions=True
+        )
+        
+        fetched_at = datetime.now().timestamp()
+        fetched = False
+        for (server_name, server_url), result in zip(pending, results):
+            if isinstance(result, Exception):
+                self._log("warning", f"⚠️ Failed to connect to {server_name}: {str(result)}")
+            else:
+                # Still-fresh entries keep their own fetch time, so re-saving never extends them
+                entries[server_name] = {"server_url": server_url, "fetched_at": fetched_at, "tools": result}
+                fetched = True
+        
+        if fetched:
+            self._save_cached_mcp_tools(entries)
+        
+        for server_name, entry in entries.items():
+            server_url = MCP_SERVERS[server_name]
+            for tool in entry["tools"]:
+                # Create Azure AI function from MCP tool
+                function_def = {
+                    "name": f"mcp_{server_name}_{tool['name']}",
+                    "description": tool["description"] or f"MCP tool: {tool['name']}",
+                    "parameters": self._convert_mcp_schema_to_openai(tool["inputSchema"])
+                }
+                
+                # Store MCP tool info for execution
+                self.mcp_tools[function_def["name"]] = {
+                    "server_url": server_url,
+                    "tool_name": tool["name"],
+                    "schema": tool["inputSchema"]
+                }
+                
+                self._log("success", f"✅ Registered MCP tool: {tool['name']} from {server_name}")
     
     def _convert_mcp_schema_to_openai(self, mcp_schema: dict) -> dict:
         """Convert MCP tool schema to OpenAI function schema"""
@@ -201,7 +427,7 @@ class AzureAIAgentManager:
         """Create Azure AI Agent with MCP tool functions following official documentation"""
         try:
             # First, check if an agent with the same name already exists
-            st.sidebar.info("🔍 Checking for existing agents...")
+            self._log("info", "🔍 Checking for existing agents...")
             
             try:
                 existing_agents = self.project_client.agents.list_agents()
@@ -217,14 +443,14 @@ class AzureAIAgentManager:
                         break
                 
                 if existing_agent:
-                    st.sidebar.success(f"✅ Found existing agent: {existing_agent.name} (ID: {existing_agent.id})")
+                    self._log("success", f"✅ Found existing agent: {existing_agent.name} (ID: {existing_agent.id})")
                     self.agent = existing_agent
                     return
                 else:
-                    st.sidebar.info(f"💡 No existing agent named '{target_agent_name}' found. Creating new agent...")
+                    self._log("info", f"💡 No existing agent named '{target_agent_name}' found. Creating new agent...")
                     
             except Exception as list_error:
-                st.sidebar.warning(f"⚠️ Could not list existing agents: {str(list_error)}. Creating new agent...")
+                self._log("warning", f"⚠️ Could not list existing agents: {str(list_error)}. Creating new agent...")
             
             # Create agent following the official Azure AI Agents quickstart pattern
             # Reference: https://learn.microsoft.com/en-us/azure/ai-services/agents/quickstart?pivots=programming-language-python-azure
@@ -237,10 +463,10 @@ class AzureAIAgentManager:
                 tools=[]  # Start with no tools for basic functionality
             )
             
-            st.sidebar.success(f"✅ Agent created successfully: {self.agent.id}")
+            self._log("success", f"✅ Agent created successfully: {self.agent.id}")
             
         except Exception as e:
-            st.sidebar.error(f"Failed to create agent: {str(e)}")
+            self._log("error", f"Failed to create agent: {str(e)}")
             raise
     
     def _create_mcp_function_wrapper(self, tool_name: str):
@@ -251,34 +477,28 @@ class AzureAIAgentManager:
             mcp_tool_name = tool_info["tool_name"]
             
             try:
-                async with streamablehttp_client(server_url) as (read_stream, write_stream, _):
+                async with streamablehttp_client(server_url, httpx_client_factory=self._http_client_factory) as (read_stream, write_stream, _):
                     async with ClientSession(read_stream, write_stream) as session:
                         await session.initialize()
                         result = await session.call_tool(mcp_tool_name, kwargs)
                         
                         # Extract text content from MCP result
-                        if hasattr(result, 'content') and result.content:
-                            first_content = result.content[0]
-                            if hasattr(first_content, 'text'):
-                                return first_content.text
-                            else:
-                                return str(first_content)
-                        else:
-                            return str(result)
+                        return self._extract_tool_text(result)
                             
             except Exception as e:
                 return f"Error executing MCP tool {mcp_tool_name}: {str(e)}"
         
         return mcp_function
     
-    async def send_message(self, message: str, chat_history: List[Dict] = None) -> Dict:
-        """Send message to Azure AI Agent with MCP tool integration"""
+    async def send_message(self, message: str, chat_history: List[Dict] = None, placeholder=None,
+                           filters: Optional[Dict] = None) -> Dict:
+        """Send message to Azure AI Agent with MCP tool integration, streaming the answer into placeholder if given"""
         if not self.is_initialized:
             return {"error": "Agent not initialized"}
             
         try:
             # Check if message requires MCP tool execution
-            mcp_result = await self._try_mcp_tools_first(message)
+            mcp_result = await self._try_mcp_tools_first(message, filters)
             if mcp_result:
                 # Enhance the user message with MCP tool results
                 enhanced_message = f"""
@@ -305,49 +525,77 @@ Please analyze this data and provide insights based on the user's query.
                 content=enhanced_message
             )
             
-            # Create and process an agent run
-            run = self.project_client.agents.runs.create_and_process(
-                thread_id=thread.id, 
+            # Stream the agent run so the answer renders as it is generated
+            answer = ""
+            run = None
+            with self.project_client.agents.runs.stream(
+                thread_id=thread.id,
                 agent_id=self.agent.id
-            )
+            ) as stream:
+                for event_type, event_data, _ in stream:
+                    if isinstance(event_data, MessageDeltaChunk):
+                        answer += event_data.text
+                        if placeholder is not None:
+                            placeholder.markdown(answer)
+                    elif isinstance(event_data, ThreadRun):
+                        run = event_data
+                    elif event_type == AgentStreamEvent.ERROR:
+                        return {"error": f"Agent run failed: {event_data}"}
             
-            # Check if the run completed successfully
-            if run.status == "completed":
-                # Fetch all messages
-                messages = self.project_client.agents.messages.list(thread_id=thread.id)
-                
-                # Find the assistant's response
-                for msg in messages:
-                    if msg.role == "assistant":
-                        content = ""
-                        for content_part in msg.content:
-                            if hasattr(content_part, 'text'):
-                                content += str(content_part.text)
-                            else:
-                                content += str(content_part)
-                        
-                        return {
-                            "success": True,
-                            "answer": content,
-                            "confidence_score": 0.9 if mcp_result else 0.7,
-                            "requires_visualization": self._detect_visualization_request(message),
-                            "sources": ["MCP Tools"] if mcp_result else []
-                        }
-                
-                return {"success": True, "answer": "No response from agent", "confidence_score": 0.5}
-                
-            elif run.status == "failed":
+            if run is None:
+                return {"error": "Agent run ended without reporting a status"}
+            if run.status == "failed":
                 return {"error": f"Agent run failed: {run.last_error if hasattr(run, 'last_error') else 'Unknown error'}"}
-            else:
+            if run.status != "completed":
+                # expired, cancelled, incomplete and requires_action runs produced no usable answer
                 return {"error": f"Agent run status: {run.status}"}
             
+            if not answer:
+                return {"success": True, "answer": "No response from agent", "confidence_score": 0.5}
+            
+            return {
+                "success": True,
+                "answer": answer,
+                "confidence_score": 0.9 if mcp_result else 0.7,
+                "requires_visualization": detect_visualization_request(message.lower()),
+                "sources": ["MCP Tools"] if mcp_result else []
+            }
+            
         except Exception as e:
             return {"error": f"Agent execution failed: {str(e)}"}
     
-    async def _try_mcp_tools_first(self, message: str) -> Optional[str]:
-        """Try to execute relevant MCP tools based on the message content"""
+    async def prefetch_mcp(self, queries: List[str]) -> Dict[str, Optional[str]]:
+        """Batch-fetch MCP results on a worker thread's own loop, closing that loop's pool when done"""
+        try:
+            return dict(zip(queries, await self.batch_mcp(queries)))
+        finally:
+            # The loop ends with asyncio.run, so its pooled connections would otherwise leak
+            await self.close()
+    
+    async def batch_mcp(self, queries: List[str]) -> List[Optional[str]]:
+        """Run the MCP tool fan-out for several queries in one concurrent batch"""
+        results = await asyncio.gather(
+            *(self._try_mcp_tools_first(query) for query in queries),
+            return_exceptions=True
+        )
+        return [None if isinstance(result, Exception) else result for result in results]
+    
+    async def _try_mcp_tools_first(self, message: str, filters: Optional[Dict] = None) -> Optional[str]:
+        """Try to execute relevant MCP tools based on the message content and optional search filters"""
         if not USE_MCP:
             return None
+        
+        # Concurrent callers asking about the same message share one in-flight fan-out
+        key = (id(asyncio.get_running_loop()), message, tuple(sorted((filters or {}).items())))
+        task = self._mcp_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_mcp_tools(message, filters))
+            self._mcp_inflight[key] = task
+            task.add_done_callback(lambda _: self._mcp_inflight.pop(key, None))
+        return await task
+    
+    async def _run_mcp_tools(self, message: str, filters: Optional[Dict] = None) -> Optional[str]:
+        """Execute the MCP tools selected for the message and join their results"""
             
         # Determine which MCP tools to use based on message content
         tools_to_try = []
@@ -355,80 +603,85 @@ Please analyze this data and provide insights based on the user's query.
         message_lower = message.lower()
         
         # Corporate actions search keywords
-        if any(keyword in message_lower for keyword in [
-            "corporate actions", "dividend", "split", "merger", "acquisition", 
-            "recent", "latest", "summary", "events", "stock split", "spinoff"
-        ]):
+        if any(keyword in message_lower for keyword in CORPORATE_ACTION_KEYWORDS):
             tools_to_try.append(("rag", "rag_query"))
             tools_to_try.append(("rag", "search_corporate_actions"))
         
         # Web search keywords
-        if any(keyword in message_lower for keyword in [
-            "news", "market", "financial news", "announcements", "press release"
-        ]):
+        if any(keyword in message_lower for keyword in NEWS_KEYWORDS):
             tools_to_try.append(("websearch", "web_search"))
             tools_to_try.append(("websearch", "news_search"))
         
         # If no specific tools identified, try general search
         if not tools_to_try:
             tools_to_try.append(("rag", "rag_query"))
+
+        # Drop duplicate tools while preserving order
+        tools_to_try = list(dict.fromkeys(tools_to_try))
+
+        # Structured search already covers what rag_query would return for these queries
+        if ("rag", "search_corporate_actions") in tools_to_try:
+            tools_to_try = [t for t in tools_to_try if t != ("rag", "rag_query")]
+
+        # Resolve server URLs and arguments up front so the calls can run concurrently
+        plan = [
+            (MCP_SERVERS[server_name], tool_name,
+             MCP_TOOL_ARG_BUILDERS.get(tool_name, default_mcp_tool_args)(message))
+            for server_name, tool_name in tools_to_try
+            if server_name in MCP_SERVERS
+        ]
+        
+        # Let the rag server apply structured search filters itself
+        if filters:
+            plan = [
+                (server_url, tool_name,
+                 {**args, **search_filter_args(filters)} if tool_name == "search_corporate_actions" else args)
+                for server_url, tool_name, args in plan
+            ]
         
         # Execute MCP tools and collect results
-        results = []
+        outputs = await asyncio.gather(
+            *(self._execute_mcp_tool_direct(server_url, tool_name, args) for server_url, tool_name, args in plan),
+            return_exceptions=True
+        )
         
-        for server_name, tool_name in tools_to_try:
-            try:
-                server_url = MCP_SERVERS.get(server_name)
-                if not server_url:
-                    continue
-                      # Prepare arguments based on tool type
-                if tool_name == "rag_query":
-                    args = {"query": message, "max_results": 5, "chat_history": ""}
-                elif tool_name == "search_corporate_actions":
-                    args = {"search_text": message, "limit": 10}
-                elif tool_name in ["web_search", "news_search"]:
-                    args = {"query": message, "max_results": 5}
-                else:
-                    args = {"query": message}
-                
-                # Execute MCP tool
-                result = await self._execute_mcp_tool_direct(server_url, tool_name, args)
-                if result and "Error" not in result:
-                    results.append(f"**{tool_name.replace('_', ' ').title()}:**\n{result}")
-                    
-            except Exception as e:
-                st.sidebar.warning(f"⚠️ MCP tool {tool_name} failed: {str(e)}")
-                continue
+        results = []
+        for (_, tool_name, _), result in zip(plan, outputs):
+            if isinstance(result, Exception):
+                self._log("warning", f"⚠️ MCP tool {tool_name} failed: {str(result)}")
+            elif result and "Error" not in result:
+                results.append(f"**{tool_name.replace('_', ' ').title()}:**\n{result}")
         
         return "\n\n".join(results) if results else None
     
     async def _execute_mcp_tool_direct(self, server_url: str, tool_name: str, arguments: Dict) -> str:
         """Execute MCP tool directly with given arguments"""
         try:
-            async with streamablehttp_client(server_url) as (read_stream, write_stream, _):
+            async with streamablehttp_client(server_url, httpx_client_factory=self._http_client_factory) as (read_stream, write_stream, _):
                 async with ClientSession(read_stream, write_stream) as session:
                     await session.initialize()
                     result = await session.call_tool(tool_name, arguments)
                     
-                    if hasattr(result, 'content') and result.content:
-                        first_content = result.content[0]
-                        if hasattr(first_content, 'text'):
-                            return first_content.text
-                        else:
-                            return str(first_content)
-                    else:
-                        return str(result)
+                    return self._extract_tool_text(result)
                         
         except Exception as e:
             return f"Error executing MCP tool: {str(e)}"
     
-    def _detect_visualization_request(self, message: str) -> bool:
-        """Detect if message requests visualization"""
-        viz_keywords = [
-            "chart", "graph", "plot", "visualize", "visualization", "show", "display",
-            "pie chart", "bar chart", "timeline", "dashboard", "metrics"
-        ]
-        return any(keyword in message.lower() for keyword in viz_keywords)
+    @staticmethod
+    def _extract_tool_text(result) -> str:
+        """Extract text from an MCP CallToolResult without stringifying pydantic models"""
+        content = getattr(result, "content", None)
+        if not content:
+            return ""
+        
+        # Fast path for the usual single text block
+        if len(content) == 1 and isinstance(content[0], TextContent):
+            return content[0].text
+        
+        return "\n".join(
+            c.text if isinstance(c, TextContent) else c.model_dump_json()
+            for c in content
+        )
     
     async def check_existing_agent(self):
         """Check if an agent with the configured name already exists"""
@@ -463,10 +716,24 @@ Please analyze this data and provide insights based on the user's query.
             return False
             
         except Exception as e:
-            st.sidebar.warning(f"⚠️ Could not check existing agents: {str(e)}")
+            self._log("warning", f"⚠️ Could not check existing agents: {str(e)}")
             return False
 
 # Initialize Azure AI Agent Manager
+@st.cache_resource
+def get_prefetch_executor():
+    """Worker threads that prefetch MCP data while the user picks a page"""
+    return ThreadPoolExecutor(max_workers=2)
+
+def run_async(coro):
+    """Run a coroutine on this session's persistent event loop"""
+    loop = st.session_state.get("_event_loop")
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        st.session_state["_event_loop"] = loop
+    asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
+
 @st.cache_resource
 def get_azure_ai_agent():
     """Get or create Azure AI Agent Manager"""
@@ -475,6 +742,7 @@ def get_azure_ai_agent():
 agent_manager = get_azure_ai_agent()
 
 # Helper functions for sample data (when MCP/Azure AI not available)
+@st.cache_data
 def get_enhanced_sample_events_from_mcp(mcp_response: str) -> List[Dict]:
     """Generate enhanced sample events based on MCP response content"""
     base_events = get_sample_events()
@@ -482,23 +750,11 @@ def get_enhanced_sample_events_from_mcp(mcp_response: str) -> List[Dict]:
     # Analyze MCP response for insights to enhance sample data
     response_lower = mcp_response.lower()
     
-    # Adjust event counts and types based on MCP insights
-    enhanced_events = []
-    
     # Extract company names mentioned in MCP response
     mentioned_companies = []
-    company_patterns = [
-        r'apple\s+inc', r'microsoft\s+corp', r'tesla\s+inc', 
-        r'alphabet\s+inc', r'nvidia\s+corp', r'amazon\s+com',
-        r'meta\s+platforms', r'google', r'apple', r'microsoft',
-        r'tesla', r'nvidia', r'amazon', r'meta'
-    ]
-    
-    for pattern in company_patterns:
-        if re.search(pattern, response_lower):
-            company_name = pattern.replace(r'\s+', ' ').replace('\\', '').title()
-            if company_name not in mentioned_companies:
-                mentioned_companies.append(company_name)
+    for pattern, company_name in COMPANY_PATTERNS:
+        if pattern.search(response_lower) and company_name not in mentioned_companies:
+            mentioned_companies.append(company_name)
     
     # Enhanced event types based on MCP content
     event_type_weights = {
@@ -509,32 +765,32 @@ def get_enhanced_sample_events_from_mcp(mcp_response: str) -> List[Dict]:
         'special_dividend': 2 if 'special' in response_lower else 1
     }
     
-    # Generate events with MCP-influenced data
-    import random
-    random.seed(42)  # For consistent results
+    # Generate events with MCP-influenced data, drawing all random fields at once
+    rng = np.random.default_rng(42)  # For consistent results
+    confidence_scores = rng.uniform(0.8, 0.95, len(base_events))
+    market_impacts = rng.choice(np.array(['High', 'Medium', 'Low']), len(base_events))
     
-    for i, base_event in enumerate(base_events):
-        enhanced_event = base_event.copy()
-        
-        # Update with mentioned companies if available
-        if mentioned_companies and i < len(mentioned_companies):
-            enhanced_event['company_name'] = mentioned_companies[i]
-            enhanced_event['symbol'] = mentioned_companies[i][:4].upper()
-        
-        # Add MCP-derived fields
-        enhanced_event['data_source'] = 'MCP-Enhanced'
-        enhanced_event['confidence_score'] = random.uniform(0.8, 0.95)
-        enhanced_event['market_impact'] = random.choice(['High', 'Medium', 'Low'])
-        
-        # Add description based on MCP insights
-        if 'market volatility' in response_lower:
-            enhanced_event['market_conditions'] = 'Volatile'
-        elif 'stable' in response_lower:
-            enhanced_event['market_conditions'] = 'Stable'
-        else:
-            enhanced_event['market_conditions'] = 'Normal'
-        
-        enhanced_events.append(enhanced_event)
+    # Market conditions depend only on the response, so resolve them once
+    if 'market volatility' in response_lower:
+        market_conditions = 'Volatile'
+    elif 'stable' in response_lower:
+        market_conditions = 'Stable'
+    else:
+        market_conditions = 'Normal'
+    
+    enhanced_events = [
+        {
+            **base_event,
+            # Update with mentioned companies if available
+            **({'company_name': mentioned_companies[i], 'symbol': mentioned_companies[i][:4].upper()}
+               if i < len(mentioned_companies) else {}),
+            'data_source': 'MCP-Enhanced',
+            'confidence_score': float(confidence_scores[i]),
+            'market_impact': str(market_impacts[i]),
+            'market_conditions': market_conditions
+        }
+        for i, base_event in enumerate(base_events)
+    ]
     
     # Add additional events if MCP suggests high activity
     if 'increased activity' in response_lower or 'busy' in response_lower:
@@ -566,6 +822,7 @@ def get_enhanced_sample_events_from_mcp(mcp_response: str) -> List[Dict]:
     
     return enhanced_events
 
+@st.cache_data
 def get_sample_events():
     """Get sample events for demo"""
     return [
@@ -621,40 +878,182 @@ def normalize_event_data(events: List[Dict]) -> List[Dict]:
     normalized = []
     
     for event in events:
-        # Handle different field name variations
-        normalized_event = {}
-        
-        # Company name normalization - prioritize existing company_name, then try various fallbacks
-        company_name = (
-            event.get("company_name") or 
-            event.get("issuer_name") or 
-            event.get("issuer", {}).get("name") if isinstance(event.get("issuer"), dict) else
-            event.get("issuer") or
-            "Unknown Company"
-        )
-        normalized_event["company_name"] = event.get("issuer_name")
+        # Copy all other fields, dropping the issuer variants folded into company_name
+        normalized_event = {key: value for key, value in event.items() if key not in ("issuer_name", "issuer")}
+        
+        # Company name normalization - prioritize existing company_name, then issuer fields
+        company_name = event.get("company_name")
+        if company_name is None:
+            company_name = event.get("issuer_name")
+        if company_name is None:
+            issuer = event.get("issuer")
+            company_name = issuer.get("name") if isinstance(issuer, dict) else issuer
+        normalized_event["company_name"] = "Unknown Company" if company_name is None else company_name
+        
+        # Ensure symbol field exists, falling back to the nested security record
+        if normalized_event.get("symbol") is None:
+            security = event.get("security")
+            symbol = security.get("symbol") if isinstance(security, dict) else None
+            normalized_event["symbol"] = "N/A" if symbol is None else symbol
         
-        # Copy all other fields, avoiding duplicates
-        for key, value in event.items():
-            if key not in ["issuer_name", "issuer"] or key == "company_name":
-                normalized_event[key] = value
-        
-        # Ensure symbol field exists
-        if "symbol" not in normalized_event:
-            if "security" in event and isinstance(event["security"], dict):
-                normalized_event["symbol"] = event["security"].get("symbol", "N/A")
-            else:
-                normalized_event["symbol"] = "N/A"
-                
         # Ensure required fields exist
-        for required_field in ["event_type", "status", "announcement_date"]:
-            if required_field not in normalized_event:
+        for required_field in ("event_type", "status", "announcement_date"):
+            if normalized_event.get(required_field) is None:
                 normalized_event[required_field] = "N/A"
         
         normalized.append(normalized_event)
     
     return normalized
 
+def loads_json(data):
+    """Parse a JSON payload with orjson when available; errors are json.JSONDecodeError subclasses"""
+    if USE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def iter_json_objects(text: str):
+    """Yield each top-level JSON object embedded in text, scanning the string once"""
+    # Sniff the first character: whole-payload JSON goes straight through the fast parser,
+    # anything else (text with embedded JSON) goes directly to the scan below
+    first = text.lstrip()[:1]
+    if first in ('{', '['):
+        try:
+            obj = loads_json(text)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(obj, dict):
+                yield obj
+            else:
+                yield from (item for item in obj if isinstance(item, dict))
+            return
+    
+    decoder = json.JSONDecoder()
+    idx = 0
+    while True:
+        idx = text.find('{', idx)
+        if idx < 0:
+            return
+        try:
+            obj, idx = decoder.raw_decode(text, idx)
+        except json.JSONDecodeError:
+            idx += 1
+            continue
+        yield obj
+
+def extract_event_objects(text: str) -> List[Dict]:
+    """Collect events from JSON in an MCP response, unwrapping events/results/sources lists"""
+    events = []
+    for obj in iter_json_objects(text):
+        if 'event_type' in obj:
+            events.append(obj)
+            continue
+        for key in ("events", "results", "sources"):
+            value = obj.get(key)
+            if isinstance(value, list):
+                events.extend(e for e in value if isinstance(e, dict) and 'event_type' in e)
+    return events
+
+def take_prefetched_mcp(query: str) -> Optional[str]:
+    """Take this session's background-prefetched MCP result, waiting a bounded time if it is still running"""
+    prefetch = st.session_state.get("mcp_prefetch")
+    if prefetch is None:
+        return None
+    try:
+        return prefetch.result(timeout=PREFETCH_WAIT_TIMEOUT).pop(query, None)
+    except Exception:
+        return None
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_and_parse_mcp(query: str, _prefetched: Optional[str] = None) -> tuple:
+    """Run MCP tools for a query and parse events from the response, cached per query"""
+    # Use the caller's prefetched result if it has one (underscore: not part of the cache key)
+    mcp_data = _prefetched
+    if mcp_data is None:
+        mcp_data = run_async(agent_manager._try_mcp_tools_first(query))
+    
+    if not mcp_data:
+        raise Exception("No MCP data received")
+    
+    # Try to parse structured data
+    parsed_events = extract_event_objects(mcp_data)
+    
+    if parsed_events:
+        return normalize_event_data(parsed_events), "Live MCP Data"
+    return get_enhanced_sample_events_from_mcp(mcp_data), "MCP-Enhanced Data"
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def build_analytics_view(analytics_data: List[Dict]) -> Dict[str, Any]:
+    """Build the analytics DataFrame and every aggregate derived from it"""
+    import pandas as pd
+    
+    df = None
+    if USE_PYARROW:
+        # Columnar construction skips per-cell object inference and keeps strings Arrow-backed
+        try:
+            df = pa.Table.from_pylist(analytics_data).to_pandas(types_mapper=pd.ArrowDtype)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            df = None  # Mixed-type fields; fall back to the object constructor
+    if df is None:
+        df = pd.DataFrame(analytics_data)
+        df['status'] = df['status'].astype('category')
+    # Dates arrive as ISO strings; the explicit format keeps parsing on pandas' fast C path
+    df['announcement_date'] = pd.to_datetime(df['announcement_date'], errors='coerce', format='ISO8601', cache=True)
+    
+    # Filter out rows with invalid dates (NaT)
+    valid_dates_df = df.dropna(subset=['announcement_date'])
+    status_counts = df['status'].value_counts().to_dict()
+    total_events = len(df)
+    unique_companies = df['company_name'].nunique()
+    
+    return {
+        "df": df,
+        "status_counts": status_counts,
+        # KPI values are formatted once per dataset
+        "kpis": {
+            "total_events": total_events,
+            "confirmed_rate": f"{status_counts.get('confirmed', 0) / total_events * 100:.1f}%",
+            "unique_companies": unique_companies,
+            "avg_events_per_company": f"{total_events / unique_companies:.1f}"
+        },
+        # Bin to calendar days so time-of-day stamps don't explode the group count;
+        # the sort is kept because px.line draws points in row order
+        "timeline_data": valid_dates_df.groupby(
+            [valid_dates_df['announcement_date'].dt.normalize(), 'event_type'], observed=True
+        ).size().reset_index(name='count'),
+        "company_type_matrix": df.groupby(['company_name', 'event_type'], sort=False, observed=True).size().unstack(fill_value=0),
+        # Options that seed the interactive filter multiselects
+        "filter_options": {
+            column: df[column].unique().tolist()
+            for column in ('company_name', 'event_type', 'status')
+        }
+    }
+
+# Each distinct filter selection caches its own figures, so keep the cache bounded
+FIGURE_CACHE_TTL = 600  # seconds
+FIGURE_CACHE_MAX_ENTRIES = 32
+
+@st.cache_resource(ttl=FIGURE_CACHE_TTL, max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def build_status_pie(status_counts: tuple):
+    """Build the filtered status pie chart for a tuple of (status, count) pairs"""
+    import plotly.express as px
+    return px.pie(
+        values=[count for _, count in status_counts],
+        names=[status for status, _ in status_counts],
+        title="Filtered Events - Status Distribution"
+    )
+
+@st.cache_resource(ttl=FIGURE_CACHE_TTL, max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def build_company_bar(company_counts: tuple):
+    """Build the filtered company activity bar chart for a tuple of (company, count) pairs"""
+    import plotly.express as px
+    return px.bar(
+        x=[count for _, count in company_counts],
+        y=[company for company, _ in company_counts],
+        orientation='h',
+        title="Filtered Events - Company Activity"
+    )
+
 def extract_events_from_response(response_text: str) -> List[Dict]:
     """Extract event data from AI Agent response - simplified version"""
     # This would parse the AI response to extract structured event data
@@ -662,8 +1061,7 @@ def extract_events_from_response(response_text: str) -> List[Dict]:
     events = []
     
     # Look for company mentions in response
-    import re
-    companies = re.findall(r'([A-Z]{2,5})', response_text)
+    companies = SYMBOL_PATTERN.findall(response_text)
     
     if companies:
         for i, symbol in enumerate(companies[:5]):  # Limit to 5 events
@@ -917,18 +1315,15 @@ def show_dashboard_metrics_and_events():
     st.write(f"**Debug - Current User ID:** `{st.session_state.user_id}`")
     
     # Dashboard metrics
+    type_counts = Counter(e.get('event_type') for e in st.session_state.dashboard_events)
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric("📅 Total Events", len(st.session_state.dashboard_events))
     with col2:
-        dividend_count = len([e for e in st.session_state.dashboard_events 
-                            if e.get('event_type') == 'dividend'])
-        st.metric("💰 Dividends", dividend_count)
+        st.metric("💰 Dividends", type_counts.get('dividend', 0))
     with col3:
-        split_count = len([e for e in st.session_state.dashboard_events 
-                         if e.get('event_type') == 'stock_split'])
-        st.metric("📈 Stock Splits", split_count)
+        st.metric("📈 Stock Splits", type_counts.get('stock_split', 0))
     with col4:
         # Count total inquiries across all events from embedded data
         total_inquiries = 0
@@ -1069,12 +1464,9 @@ def show_inquiry_modal_create(event_data: Dict[str, Any]):
             if st.form_submit_button("Create Inquiry", type="primary"):
                 if subject and description:
                     with st.spinner("🔧 Creating inquiry via MCP tools..."):
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        
                         try:
                             # Call create_inquiry_tool using MCP directly
-                            inquiry_response = loop.run_until_complete(
+                            inquiry_response = run_async(
                                 agent_manager._execute_mcp_tool_direct(
                                     server_url=MCP_SERVERS["rag"],
                                     tool_name="create_inquiry_tool",
@@ -1091,8 +1483,7 @@ def show_inquiry_modal_create(event_data: Dict[str, Any]):
                             )
                             
                             # Parse the JSON response
-                            import json
-                            result = json.loads(inquiry_response)
+                            result = loads_json(inquiry_response)
                             
                             if result.get("success"):
                                 st.success("✅ Inquiry created successfully!")
@@ -1107,8 +1498,6 @@ def show_inquiry_modal_create(event_data: Dict[str, Any]):
                                 
                         except Exception as e:
                             st.error(f"❌ Error creating inquiry: {str(e)}")
-                        finally:
-                            loop.close()
                 else:
                     st.error("Please fill in both subject and description")
         
@@ -1124,12 +1513,9 @@ def show_inquiry_modal_view(event_data: Dict[str, Any]):
     st.subheader(f"👁️ View Inquiries - {event_data.get('company_name', 'N/A')}")
     
     with st.spinner("🔧 Fetching inquiries via MCP tools..."):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
         try:
             # Call get_inquiries_tool using MCP directly
-            inquiries_response = loop.run_until_complete(
+            inquiries_response = run_async(
                 agent_manager._execute_mcp_tool_direct(
                     server_url=MCP_SERVERS["rag"],
                     tool_name="get_inquiries_tool",
@@ -1138,8 +1524,7 @@ def show_inquiry_modal_view(event_data: Dict[str, Any]):
             )
             
             # Parse the JSON response
-            import json
-            result = json.loads(inquiries_response)
+            result = loads_json(inquiries_response)
             inquiries = result.get("inquiries", [])
             
             if inquiries:
@@ -1172,22 +1557,8 @@ def show_inquiry_modal_view(event_data: Dict[str, Any]):
                 for inquiry in filtered_inquiries:
                     with st.container():
                         # Color coding based on priority and status
-                        priority_color = {
-                            "LOW": "#28a745", 
-                            "MEDIUM": "#ffc107", 
-                            "HIGH": "#fd7e14", 
-                            "URGENT": "#dc3545"
-                        }.get(inquiry.get('priority', 'MEDIUM'), "#ffc107")
-                        
-                        status_color = {
-                            "OPEN": "#17a2b8",
-                            "ACKNOWLEDGED": "#6c757d", 
-                            "IN_REVIEW": "#007bff",
-                            "RESPONDED": "#28a745",
-                            "ESCALATED": "#dc3545",
-                            "RESOLVED": "#20c997",
-                            "CLOSED": "#6c757d"
-                        }.get(inquiry.get('status', 'OPEN'), "#17a2b8")
+                        priority_color = INQUIRY_PRIORITY_COLORS.get(inquiry.get('priority', 'MEDIUM'), "#ffc107")
+                        status_color = INQUIRY_STATUS_COLORS.get(inquiry.get('status', 'OPEN'), "#17a2b8")
                         
                         st.markdown(f"""
                         <div style="border-left: 4px solid {priority_color}; padding: 1rem; margin: 0.5rem 0; background: #f8f9fa; border-radius: 5px;">
@@ -1213,8 +1584,6 @@ def show_inquiry_modal_view(event_data: Dict[str, Any]):
                 
         except Exception as e:
             st.error(f"❌ Error fetching inquiries: {str(e)}")
-        finally:
-            loop.close()
     
     if st.button("Close View", type="primary"):
         st.session_state.selected_event_for_inquiry = None
@@ -1228,12 +1597,9 @@ def show_inquiry_modal_edit(event_data: Dict[str, Any]):
     
     # Get user's inquiries for this event
     with st.spinner("🔧 Loading your inquiries..."):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
         try:
             # Call get_inquiries_tool and filter for user
-            inquiries_response = loop.run_until_complete(
+            inquiries_response = run_async(
                 agent_manager._execute_mcp_tool_direct(
                     server_url=MCP_SERVERS["rag"],
                     tool_name="get_inquiries_tool",
@@ -1242,16 +1608,13 @@ def show_inquiry_modal_edit(event_data: Dict[str, Any]):
             )
             
             # Parse and filter for user's inquiries
-            import json
-            result = json.loads(inquiries_response)
+            result = loads_json(inquiries_response)
             all_inquiries = result.get("inquiries", [])
             user_inquiries = [inq for inq in all_inquiries if inq.get("user_id") == st.session_state.user_id]
             
         except Exception as e:
             st.error(f"❌ Error loading inquiries: {str(e)}")
             user_inquiries = []
-        finally:
-            loop.close()
     
     if user_inquiries:
         st.info(f"You have {len(user_inquiries)} inquiries for this corporate action")
@@ -1290,12 +1653,9 @@ def show_inquiry_modal_edit(event_data: Dict[str, Any]):
                         if st.form_submit_button("Update Inquiry", type="primary"):
                             if new_subject and new_description:
                                 with st.spinner("🔧 Updating inquiry..."):
-                                    loop = asyncio.new_event_loop()
-                                    asyncio.set_event_loop(loop)
-                                    
                                     try:
                                         # Use direct MCP tool call to update inquiry
-                                        inquiry_response = loop.run_until_complete(
+                                        inquiry_response = run_async(
                                             agent_manager._execute_mcp_tool_direct(
                                                 server_url=MCP_SERVERS["rag"],
                                                 tool_name="update_inquiry_tool",
@@ -1309,8 +1669,7 @@ def show_inquiry_modal_edit(event_data: Dict[str, Any]):
                                         )
                                         
                                         # Parse the JSON response
-                                        import json
-                                        result = json.loads(inquiry_response)
+                                        result = loads_json(inquiry_response)
                                         
                                         if result.get("success"):
                                             st.success("✅ Inquiry updated successfully!")
@@ -1326,8 +1685,6 @@ def show_inquiry_modal_edit(event_data: Dict[str, Any]):
                                         
                                     except Exception as e:
                                         st.error(f"❌ Error updating inquiry: {str(e)}")
-                                    finally:
-                                        loop.close()
                             else:
                                 st.error("Please fill in both subject and description")
                     
@@ -1361,79 +1718,45 @@ def show_inquiry_modal_edit(event_data: Dict[str, Any]):
                     del st.session_state.inquiry_modal_type
                 st.rerun()
 
-# Custom CSS
-st.markdown("""
+def render_chat_message(msg: Dict[str, Any]):
+    """Render one chat history entry with its role header"""
+    if msg["role"] == "user":
+        st.markdown(f"""
+        <div class="chat-message user-message">
+            <strong>👤 You:</strong>
+        </div>
+        """, unsafe_allow_html=True)
+        st.markdown(msg["content"])
+    else:
+        st.markdown(f"""
+        <div class="chat-message assistant-message">
+            <strong>🤖 AI Assistant:</strong>
+        </div>
+        """, unsafe_allow_html=True)
+        content = msg["content"]
+        value = content.get("value") if isinstance(content, dict) else None
+        st.markdown(value if value is not None else content)
+
+# Static page chrome: CSS from style.css plus the main header
+@st.cache_data
+def load_page_chrome() -> str:
+    """Build the CSS and header markup once and reuse the string on every rerun"""
+    css_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "style.css")
+    with open(css_path, "r", encoding="utf-8") as f:
+        css = f.read()
+    
+    return f"""
 <style>
-    .main-header {
-        background: linear-gradient(90deg, #1e3a8a 0%, #3b82f6 50%, #06b6d4 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    
-    .metric-container {
-        background: #f8fafc;
-        padding: 1rem;
-        border-radius: 8px;
-        border-left: 4px solid #3b82f6;
-        margin: 0.5rem 0;
-    }
-    
-    .status-confirmed { 
-        background-color: #d4edda; 
-        color: #155724; 
-        padding: 0.25rem 0.5rem; 
-        border-radius: 4px; 
-        font-weight: bold;
-    }
-    .status-announced { 
-        background-color: #fff3cd; 
-        color: #856404; 
-        padding: 0.25rem 0.5rem; 
-        border-radius: 4px; 
-        font-weight: bold;
-    }
-    .status-pending { 
-        background-color: #f8d7da; 
-        color: #721c24; 
-        padding: 0.25rem 0.5rem; 
-        border-radius: 4px; 
-        font-weight: bold;
-    }
-    .status-processed { 
-        background-color: #d1ecf1; 
-        color: #0c5460; 
-        padding: 0.25rem 0.5rem; 
-        border-radius: 4px; 
-        font-weight: bold;
-    }
-    
-    .chat-message {
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 0.5rem 0;
-    }
-    .user-message {
-        background-color: #e3f2fd;
-        border-left: 4px solid #2196f3;
-    }
-    .assistant-message {
-        background-color: #f3e5f5;
-        border-left: 4px solid #9c27b0;
-    }
+{css}
 </style>
-""", unsafe_allow_html=True)
-
-# Main header
-st.markdown("""
 <div class="main-header">
     <h1>🤖 Corporate Actions Dashboard</h1>
     <h3>Powered by Azure AI Agent Service + MCP Integration</h3>
     <p>AI-driven insights with real-time corporate actions data and advanced analytics</p>
 </div>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(load_page_chrome(), unsafe_allow_html=True)
 
 # Sidebar for navigation and settings
 st.sidebar.markdown("## 🎛️ Navigation")
@@ -1454,10 +1777,7 @@ if "existing_agent_found" not in st.session_state:
 # Check for existing agent on first load
 if not st.session_state.existing_agent_checked:
     with st.spinner("🔍 Checking for existing Azure AI Agent..."):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        st.session_state.existing_agent_found = loop.run_until_complete(agent_manager.check_existing_agent())
-        loop.close()
+        st.session_state.existing_agent_found = run_async(agent_manager.check_existing_agent())
         st.session_state.existing_agent_checked = True
         
         # If agent exists, mark as initialized
@@ -1468,35 +1788,29 @@ if not st.session_state.existing_agent_checked:
 with st.sidebar:
     st.markdown("### 🤖 Azure AI Agent Status")
     
+    # The pages below read agent_initialized later in this same run, so no extra rerun is needed
+    agent_action_slot = st.empty()
     if not st.session_state.agent_initialized:
         # Only show initialize button if no existing agent found
         if not st.session_state.existing_agent_found:
-            if st.button("🚀 Initialize Azure AI Agent", type="primary"):
+            if agent_action_slot.button("🚀 Initialize Azure AI Agent", type="primary"):
                 with st.spinner("Initializing Azure AI Agent with MCP tools..."):
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    success = loop.run_until_complete(agent_manager.initialize())
-                    loop.close()
+                    success = run_async(agent_manager.initialize())
                     
                     if success:
                         st.session_state.agent_initialized = True
-                        st.success("✅ Agent initialized successfully!")
-                        st.rerun()
+                        agent_action_slot.success("✅ Agent initialized successfully!")
                     else:
                         st.error("❌ Failed to initialize agent")
         else:
             # Show activate button for existing agent
-            if st.button("🔗 Connect to Existing Agent", type="primary"):
+            if agent_action_slot.button("🔗 Connect to Existing Agent", type="primary"):
                 with st.spinner("Connecting to existing Azure AI Agent..."):
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    success = loop.run_until_complete(agent_manager.initialize())
-                    loop.close()
+                    success = run_async(agent_manager.initialize())
                     
                     if success:
                         st.session_state.agent_initialized = True
-                        st.success("✅ Connected to existing agent!")
-                        st.rerun()
+                        agent_action_slot.success("✅ Connected to existing agent!")
                     else:
                         st.error("❌ Failed to connect to agent")
     else:
@@ -1513,6 +1827,15 @@ with st.sidebar:
             st.session_state.existing_agent_found = False
             st.rerun()
 
+# Prefetch page data in the background as soon as the agent is ready
+if st.session_state.agent_initialized and "mcp_prefetch" not in st.session_state:
+    st.session_state.mcp_prefetch = get_prefetch_executor().submit(
+        lambda: asyncio.run(agent_manager.prefetch_mcp(PREFETCH_MCP_QUERIES))
+    )
+
+# Show status collected while checking or initializing the agent
+agent_manager.render_status_log()
+
 # Page selection
 page = st.sidebar.selectbox(
     "Choose a page:",
@@ -1569,12 +1892,10 @@ if page == "🏠 Dashboard":
                     with st.spinner("🤖 Retrieving your subscriptions from CosmosDB..."):
                         try:
                             # Use the agent manager's MCP tool execution method
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
                             
                             try:
                                 # Call get_subscription_tool using the MCP protocol
-                                subscription_response = loop.run_until_complete(
+                                subscription_response = run_async(
                                     agent_manager._execute_mcp_tool_direct(
                                         server_url=MCP_SERVERS["rag"],
                                         tool_name="get_subscription_tool",
@@ -1587,8 +1908,7 @@ if page == "🏠 Dashboard":
                                 #st.text(subscription_response)
                                 
                                 # Parse the JSON response
-                                import json
-                                subscription_data = json.loads(subscription_response)
+                                subscription_data = loads_json(subscription_response)
                                 
                                 # Extract subscription information
                                 subscription = subscription_data.get("subscription")
@@ -1623,8 +1943,6 @@ if page == "🏠 Dashboard":
                                 if st.button("🔧 Use Test Subscriptions"):
                                     st.session_state.user_subscriptions = ["AAPL", "MSFT", "TSLA"]
                                     st.success("✅ Using test subscriptions: AAPL, MSFT, TSLA")
-                            finally:
-                                loop.close()
                                 
                         except Exception as e:
                             st.error(f"❌ Error loading subscriptions: {str(e)}")
@@ -1640,12 +1958,10 @@ if page == "🏠 Dashboard":
                     with st.spinner("🤖 Retrieving corporate actions data..."):
                         try:
                             # Use the agent manager's MCP tool execution method
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
                             
                             try:
                                 # Call get_upcoming_events_tool using the MCP protocol
-                                events_response = loop.run_until_complete(
+                                events_response = run_async(
                                     agent_manager._execute_mcp_tool_direct(
                                         server_url=MCP_SERVERS["rag"],
                                         tool_name="get_upcoming_events_tool",
@@ -1658,8 +1974,7 @@ if page == "🏠 Dashboard":
                                 #st.text(events_response)
                                 
                                 # Parse the JSON response
-                                import json
-                                events_data = json.loads(events_response)
+                                events_data = loads_json(events_response)
                                 
                                 # Extract events information
                                 upcoming_events = events_data.get("upcoming_events", [])
@@ -1677,8 +1992,6 @@ if page == "🏠 Dashboard":
                             except Exception as tool_error:
                                 st.error(f"❌ MCP Tool Error: {str(tool_error)}")
                                 st.session_state.dashboard_events = get_sample_upcoming_events(st.session_state.user_subscriptions)
-                            finally:
-                                loop.close()
                                 
                         except Exception as e:
                             st.error(f"❌ Error loading events: {str(e)}")
@@ -1701,8 +2014,6 @@ if page == "🏠 Dashboard":
                                 with st.spinner(f"🤖 AI Agent removing {symbol}..."):
                                     remaining_symbols = [s for s in st.session_state.user_subscriptions if s != symbol]
                                     
-                                    loop = asyncio.new_event_loop()
-                                    asyncio.set_event_loop(loop)
                                     
                                     remove_request = f"""
                                     Please update subscription for user ID {st.session_state.user_id}.
@@ -1711,7 +2022,7 @@ if page == "🏠 Dashboard":
                                     """
                                     
                                     try:
-                                        response = loop.run_until_complete(
+                                        response = run_async(
                                             agent_manager.send_message(remove_request)
                                         )
                                         if response.get("success"):
@@ -1721,8 +2032,6 @@ if page == "🏠 Dashboard":
                                             st.rerun()
                                     except Exception as e:
                                         st.error(f"❌ Error: {str(e)}")
-                                    finally:
-                                        loop.close()
                 else:
                     st.info("📝 No subscriptions yet")
                 
@@ -1738,8 +2047,6 @@ if page == "🏠 Dashboard":
                             with st.spinner("🤖 AI Agent saving subscription..."):
                                 all_symbols = list(set(st.session_state.user_subscriptions + symbols))
                                 
-                                loop = asyncio.new_event_loop()
-                                asyncio.set_event_loop(loop)
                                 
                                 save_request = f"""
                                 Please save subscription for user:
@@ -1752,7 +2059,7 @@ if page == "🏠 Dashboard":
                                 """
                                 
                                 try:
-                                    response = loop.run_until_complete(
+                                    response = run_async(
                                         agent_manager.send_message(save_request)
                                     )
                                     if response.get("success"):
@@ -1762,8 +2069,6 @@ if page == "🏠 Dashboard":
                                         st.rerun()
                                 except Exception as e:
                                     st.error(f"❌ Error: {str(e)}")
-                                finally:
-                                    loop.close()
                 
                 st.markdown("---")
                 
@@ -1772,9 +2077,6 @@ if page == "🏠 Dashboard":
                 
                 if not st.session_state.dashboard_data_loaded:
                     with st.spinner("🤖 AI Agent analyzing corporate actions for your subscriptions..."):
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        
                         if st.session_state.user_subscriptions:
                             actions_request = f"""
                             Please find upcoming corporate actions for user ID {st.session_state.user_id} for the next 7 days.
@@ -1803,7 +2105,7 @@ if page == "🏠 Dashboard":
                             """
                         
                         try:
-                            response = loop.run_until_complete(
+                            response = run_async(
                                 agent_manager.send_message(actions_request)
                             )
                             
@@ -1824,8 +2126,6 @@ if page == "🏠 Dashboard":
                         except Exception as e:
                             st.error(f"❌ Error: {str(e)}")
                             st.session_state.dashboard_events = get_sample_upcoming_events(st.session_state.user_subscriptions)
-                        finally:
-                            loop.close()
                 
                 # Display dashboard metrics and events
                 show_dashboard_metrics_and_events()
@@ -1838,9 +2138,6 @@ if page == "🏠 Dashboard":
                 with col1:
                     if st.button("🤖 Analyze My Inquiries", type="primary"):
                         with st.spinner("🤖 AI Agent analyzing your inquiries..."):
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            
                             inquiry_request = f"""
                             Please analyze all inquiries for user ID {st.session_state.user_id}.
                             
@@ -1852,7 +2149,7 @@ if page == "🏠 Dashboard":
                             """
                             
                             try:
-                                response = loop.run_until_complete(
+                                response = run_async(
                                     agent_manager.send_message(inquiry_request)
                                 )
                                 if response.get("success"):
@@ -1860,15 +2157,10 @@ if page == "🏠 Dashboard":
                                     st.markdown(response.get("answer", ""))
                             except Exception as e:
                                 st.error(f"❌ Error: {str(e)}")
-                            finally:
-                                loop.close()
                 
                 with col2:
                     if st.button("🔍 Find Events Needing Attention"):
                         with st.spinner("🤖 AI Agent finding events needing attention..."):
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            
                             attention_request = f"""
                             Please identify corporate actions needing attention for user ID {st.session_state.user_id}.
                             
@@ -1880,7 +2172,7 @@ if page == "🏠 Dashboard":
                             """
                             
                             try:
-                                response = loop.run_until_complete(
+                                response = run_async(
                                     agent_manager.send_message(attention_request)
                                 )
                                 if response.get("success"):
@@ -1888,8 +2180,6 @@ if page == "🏠 Dashboard":
                                     st.markdown(response.get("answer", ""))
                             except Exception as e:
                                 st.error(f"❌ Error: {str(e)}")
-                            finally:
-                                loop.close()
 # Search Events page
 elif page == "🔍 Search Events":
     st.header("🔍 Advanced Event Search")
@@ -1924,20 +2214,20 @@ elif page == "🔍 Search Events":
             search_query += f" from {date_from} to {date_to}, limit to {limit} results. Return structured data with event details."
             
             with st.spinner("🤖 Azure AI Agent searching via MCP tools..."):
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+                # Get both the AI analysis and raw MCP search results concurrently
+                search_filters = {
+                    "search_text": search_text,
+                    "event_type": event_type,
+                    "company_name": company_name,
+                    "status": status,
+                    "limit": limit
+                }
+                response, raw_mcp_data = run_async(asyncio.gather(
+                    # Same message and filters, so both share one in-flight MCP fan-out
+                    agent_manager.send_message(search_query, filters=search_filters),
+                    agent_manager._try_mcp_tools_first(search_query, search_filters)
+                ))
                 
-                # Get both the AI analysis and raw MCP data
-                response = loop.run_until_complete(
-                    agent_manager.send_message(search_query)
-                )
-                
-                # Also try to get raw MCP search results
-                raw_mcp_data = loop.run_until_complete(
-                    agent_manager._try_mcp_tools_first(search_query)
-                )
-                
-                loop.close()
                 
                 if response.get("success"):
                     st.success("✅ Search completed by Azure AI Agent with MCP integration")
@@ -1951,30 +2241,16 @@ elif page == "🔍 Search Events":
                         st.markdown("### 📊 Search Results")
                         
                         # Try to parse structured data from MCP response
-                        json_matches = re.findall(r'\{[^{}]*\}', raw_mcp_data)
-                        search_results = []
-                        
-                        for match in json_matches:
-                            try:
-                                event_data = json.loads(match)
-                                if isinstance(event_data, dict):
-                                    search_results.append(event_data)
-                            except:
-                                continue
+                        search_results = extract_event_objects(raw_mcp_data)
                         
                         if search_results:
-                            # Apply client-side filtering to the results
-                            filtered_results = search_results
-                            
-                            if event_type:
-                                filtered_results = [e for e in filtered_results if e.get('event_type') == event_type]
-                            if company_name:
-                                filtered_results = [e for e in filtered_results if company_name.lower() in str(e.get('company_name', '')).lower()]
-                            if status:
-                                filtered_results = [e for e in filtered_results if e.get('status') == status]
-                            
-                            # Limit results
-                            filtered_results = filtered_results[:limit]
+                            # Filters were applied server-side; recheck in one pass for results from other tools
+                            filtered_results = [
+                                e for e in search_results
+                                if (not event_type or str(e.get('event_type', '')).lower() == event_type)
+                                and (not status or str(e.get('status', '')).lower() == status)
+                                and (not company_name or company_name.lower() in str(e.get('company_name', '')).lower())
+                            ][:limit]
                             
                             if filtered_results:
                                 st.success(f"📊 Found {len(filtered_results)} matching events")
@@ -2001,19 +2277,17 @@ elif page == "🔍 Search Events":
                                 
                                 # Show summary statistics
                                 st.markdown("### 📈 Search Summary")
+                                status_counts = Counter(e.get('status') for e in filtered_results)
                                 col1, col2, col3, col4 = st.columns(4)
                                 
                                 with col1:
                                     st.metric("Total Results", len(filtered_results))
                                 with col2:
-                                    confirmed = len([e for e in filtered_results if e.get('status') == 'confirmed'])
-                                    st.metric("Confirmed", confirmed)
+                                    st.metric("Confirmed", status_counts['confirmed'])
                                 with col3:
-                                    event_types = len(set(e.get('event_type') for e in filtered_results))
-                                    st.metric("Event Types", event_types)
+                                    st.metric("Event Types", len({e.get('event_type') for e in filtered_results}))
                                 with col4:
-                                    companies = len(set(e.get('company_name') for e in filtered_results))
-                                    st.metric("Companies", companies)
+                                    st.metric("Companies", len({e.get('company_name') for e in filtered_results}))
                             else:
                                 st.info("📭 No events found matching your specific criteria")
                         else:
@@ -2066,45 +2340,35 @@ elif page == "💬 AI Assistant":
     # Chat interface
     if st.session_state.agent_initialized:
         st.success("✅ Azure AI Agent is ready to help!")
-          # Display chat history
-        for i, msg in enumerate(st.session_state.chat_history):
-            if msg["role"] == "user":
-                st.markdown(f"""
-                <div class="chat-message user-message">
-                    <strong>👤 You:</strong>
-                </div>
-                """, unsafe_allow_html=True)
-                st.markdown(msg["content"])
-            else:
-                parsed = ast.literal_eval(msg["content"]) if isinstance(msg["content"], str) else msg["content"]
-                st.markdown(f"""
-                <div class="chat-message assistant-message">
-                    <strong>🤖 AI Assistant:</strong>
-                </div>
-                """, unsafe_allow_html=True)
-                st.markdown(parsed["value"])
+        # Display chat history
+        chat_history_slot = st.empty()
+        with chat_history_slot.container():
+            for msg in st.session_state.chat_history:
+                render_chat_message(msg)
 
         # Chat input
         user_input = st.chat_input("Ask about corporate actions, request analysis, or search for specific events...")
+        # A sample question clicked on the previous run is asked like typed input
+        user_input = user_input or st.session_state.pop("pending_sample_question", None)
         
         if user_input:
-            # Add user message to history
-            st.session_state.chat_history.append({"role": "user", "content": user_input})
+            # Add user message to history and show it below the existing conversation
+            user_message = {"role": "user", "content": user_input}
+            st.session_state.chat_history.append(user_message)
+            render_chat_message(user_message)
             
-            # Get AI response
+            # Get AI response, streamed into the chat as it arrives
+            answer_placeholder = st.empty()
             with st.spinner("🤖 Azure AI Agent thinking..."):
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                response = loop.run_until_complete(
-                    agent_manager.send_message(user_input, st.session_state.chat_history)
+                response = run_async(
+                    agent_manager.send_message(user_input, st.session_state.chat_history, answer_placeholder)
                 )
-                loop.close()
                 
                 if response.get("success"):
                     # Add assistant response to history
                     st.session_state.chat_history.append({
                         "role": "assistant", 
-                        "content": response["answer"]
+                        "content": {"value": response["answer"]}
                     })
                     
                     # Show confidence score if available
@@ -2116,15 +2380,13 @@ elif page == "💬 AI Assistant":
                             st.warning(f"⚠️ Medium confidence response ({confidence:.1%})")
                         else:
                             st.info(f"💡 Lower confidence response ({confidence:.1%}) - consider refining your question")
-                    
-                    st.rerun()
                 else:
                     st.error(f"❌ Error: {response.get('error', 'Unknown error')}")
         
         # Clear chat button
         if st.button("🗑️ Clear Chat History"):
             st.session_state.chat_history = []
-            st.rerun()
+            chat_history_slot.empty()
             
     else:
         st.warning("⚠️ Please initialize the Azure AI Agent from the sidebar to use the chat assistant.")
@@ -2145,13 +2407,16 @@ elif page == "💬 AI Assistant":
         for question in sample_questions:
             if st.button(f"📝 {question}", key=f"sample_{question}"):
                 if st.session_state.agent_initialized:
-                    st.session_state.chat_history.append({"role": "user", "content": question})
+                    # The chat above has already rendered, so rerun to ask the question there
+                    st.session_state.pending_sample_question = question
                     st.rerun()
                 else:
                     st.warning("Please initialize the Azure AI Agent first!")
 
 # Analytics page
 elif page == "📊 Analytics":
+    import plotly.express as px
+    
     st.header("📊 Advanced Analytics Dashboard")
     
     # Get the same dynamic data as dashboard
@@ -2161,42 +2426,14 @@ elif page == "📊 Analytics":
     if st.session_state.agent_initialized:
         # Fetch analytics data via MCP tools
         with st.spinner("🔄 Fetching analytics data from MCP servers..."):
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
             try:
-                mcp_data = loop.run_until_complete(
-                    agent_manager._try_mcp_tools_first("Get comprehensive corporate actions data for advanced analytics and trend analysis")
+                analytics_data, data_source = fetch_and_parse_mcp(
+                    ANALYTICS_MCP_QUERY, _prefetched=take_prefetched_mcp(ANALYTICS_MCP_QUERY)
                 )
-                
-                if mcp_data:
-                    # Try to parse structured data
-                    json_matches = re.findall(r'\{[^{}]*\}', mcp_data)
-                    parsed_events = []
-                    
-                    for match in json_matches:
-                        try:
-                            event_data = json.loads(match)
-                            if isinstance(event_data, dict) and 'event_type' in event_data:
-                                parsed_events.append(event_data)
-                        except:
-                            continue
-                    
-                    if parsed_events:
-                        analytics_data = normalize_event_data(parsed_events)
-                        data_source = "Live MCP Data"
-                    else:
-                        analytics_data = get_enhanced_sample_events_from_mcp(mcp_data)
-                        data_source = "MCP-Enhanced Data"
-                else:
-                    raise Exception("No MCP data received")
-                    
             except Exception as e:
                 st.warning(f"⚠️ MCP analytics data fetch failed: {str(e)}. Using sample data.")
                 analytics_data = get_sample_events()
                 data_source = "Sample Data"
-            
-            loop.close()
     else:
         analytics_data = get_sample_events()
         data_source = "Sample Data"
@@ -2207,30 +2444,38 @@ elif page == "📊 Analytics":
         st.info(f"📊 **Analytics Data Source**: {data_source} | **Events**: {len(analytics_data)} | **Updated**: {datetime.now().strftime('%H:%M:%S')}")
     with col2:
         if st.button("🔄 Refresh Data", type="secondary"):
+            fetch_and_parse_mcp.clear()
             st.rerun()
     
-    # Get data
-    df = pd.DataFrame(analytics_data)
+    # Get data, rebuilding the derived frames only when the underlying events change
+    analytics_key = hash((data_source, tuple(
+        (e.get('event_id', ''), e.get('company_name', ''), e.get('status', '')) for e in analytics_data
+    )))
+    analytics_cache = st.session_state.get("_analytics_cache")
+    if analytics_cache is None or analytics_cache["key"] != analytics_key:
+        # Reruns reuse the session copy; other sessions with the same data share the cached build
+        analytics_cache = {"key": analytics_key, **build_analytics_view(analytics_data)}
+        st.session_state["_analytics_cache"] = analytics_cache
+    
+    df = analytics_cache["df"]
     
     # Key metrics
     st.subheader("📈 Key Performance Indicators")
     col1, col2, col3, col4 = st.columns(4)
     
+    kpis = analytics_cache["kpis"]
+    
     with col1:
-        total_events = len(df)
-        st.metric("📋 Total Events", total_events)
+        st.metric("📋 Total Events", kpis["total_events"])
     
     with col2:
-        confirmed_pct = len(df[df['status'] == 'confirmed']) / total_events * 100
-        st.metric("✅ Confirmed Rate", f"{confirmed_pct:.1f}%")
+        st.metric("✅ Confirmed Rate", kpis["confirmed_rate"])
     
     with col3:
-        unique_companies = df['company_name'].nunique()
-        st.metric("🏢 Unique Companies", unique_companies)
+        st.metric("🏢 Unique Companies", kpis["unique_companies"])
     
     with col4:
-        avg_events_per_company = total_events / unique_companies
-        st.metric("📊 Avg Events/Company", f"{avg_events_per_company:.1f}")
+        st.metric("📊 Avg Events/Company", kpis["avg_events_per_company"])
     
     # Advanced visualizations
     st.subheader("📊 Advanced Visualizations")
@@ -2240,44 +2485,44 @@ elif page == "📊 Analytics":
     
     with col1:        # Timeline visualization
         st.markdown("#### 📅 Timeline Analysis")
-        df['announcement_date'] = pd.to_datetime(df['announcement_date'], errors='coerce')
-        
-        # Filter out rows with invalid dates (NaT)
-        valid_dates_df = df.dropna(subset=['announcement_date'])
-        
-        if len(valid_dates_df) > 0:
-            timeline_data = valid_dates_df.groupby(['announcement_date', 'event_type']).size().reset_index(name='count')
-            
-            fig_timeline = px.line(
-                timeline_data, 
-                x='announcement_date', 
-                y='count', 
-                color='event_type',
-                title="Corporate Actions Timeline",
-                markers=True
-            )
-            fig_timeline.update_layout(xaxis_title="Date", yaxis_title="Number of Events")
-            st.plotly_chart(fig_timeline, use_container_width=True)
+        timeline_data = analytics_cache["timeline_data"]
+        
+        if len(timeline_data) > 0:
+            # Figures are rebuilt only when the memoized analytics data changes
+            if "fig_timeline" not in analytics_cache:
+                fig_timeline = px.line(
+                    timeline_data, 
+                    x='announcement_date', 
+                    y='count', 
+                    color='event_type',
+                    title="Corporate Actions Timeline",
+                    markers=True
+                )
+                fig_timeline.update_layout(xaxis_title="Date", yaxis_title="Number of Events")
+                analytics_cache["fig_timeline"] = fig_timeline
+            st.plotly_chart(analytics_cache["fig_timeline"], use_container_width=True)
         else:
             st.warning("⚠️ No valid dates found for timeline visualization")
     
     with col2:
         # Company activity heatmap
         st.markdown("#### 🏢 Company Activity Matrix")
-        company_type_matrix = pd.crosstab(df['company_name'], df['event_type'])
-        
-        fig_heatmap = px.imshow(
-            company_type_matrix.values,
-            x=company_type_matrix.columns,
-            y=company_type_matrix.index,
-            title="Company vs Event Type Matrix",
-            color_continuous_scale="viridis"
-        )
-        fig_heatmap.update_layout(
-            xaxis_title="Event Type",
-            yaxis_title="Company"
-        )
-        st.plotly_chart(fig_heatmap, use_container_width=True)
+        if "fig_heatmap" not in analytics_cache:
+            company_type_matrix = analytics_cache["company_type_matrix"]
+            
+            fig_heatmap = px.imshow(
+                company_type_matrix.values,
+                x=company_type_matrix.columns,
+                y=company_type_matrix.index,
+                title="Company vs Event Type Matrix",
+                color_continuous_scale="viridis"
+            )
+            fig_heatmap.update_layout(
+                xaxis_title="Event Type",
+                yaxis_title="Company"
+            )
+            analytics_cache["fig_heatmap"] = fig_heatmap
+        st.plotly_chart(analytics_cache["fig_heatmap"], use_container_width=True)
     
     # Interactive filters
     st.subheader("🎛️ Interactive Analysis")
@@ -2285,58 +2530,62 @@ elif page == "📊 Analytics":
     # Add filter controls
     col1, col2, col3 = st.columns(3)
     
+    filter_options = analytics_cache["filter_options"]
+    
     with col1:
         selected_companies = st.multiselect(
             "Select Companies:",
-            options=df['company_name'].unique(),
-            default=df['company_name'].unique()[:3]
+            options=filter_options["company_name"],
+            default=filter_options["company_name"][:3]
         )
     
     with col2:
         selected_types = st.multiselect(
             "Select Event Types:",
-            options=df['event_type'].unique(),
-            default=df['event_type'].unique()
+            options=filter_options["event_type"],
+            default=filter_options["event_type"]
         )
     
     with col3:
         selected_statuses = st.multiselect(
             "Select Statuses:",
-            options=df['status'].unique(),
-            default=df['status'].unique()
+            options=filter_options["status"],
+            default=filter_options["status"]
         )
     
-    # Filter data
-    filtered_df = df[
-        (df['company_name'].isin(selected_companies)) &
-        (df['event_type'].isin(selected_types)) &
-        (df['status'].isin(selected_statuses))
-    ]
+    # Refilter and rebuild the filtered charts only when the selection changes;
+    # reruns from unrelated widgets reuse the previous result
+    filter_key = (tuple(selected_companies), tuple(selected_types), tuple(selected_statuses))
+    filtered_view = analytics_cache.get("filtered_view")
+    if filtered_view is None or filtered_view["key"] != filter_key:
+        # Filter data with one combined boolean mask over the raw column arrays
+        filter_mask = np.logical_and.reduce((
+            np.isin(df['company_name'].to_numpy(), selected_companies),
+            np.isin(df['event_type'].to_numpy(), selected_types),
+            np.isin(df['status'].to_numpy(), selected_statuses)
+        ))
+        filtered_df = df[filter_mask]
+        filtered_view = {"key": filter_key, "df": filtered_df}
+        
+        if len(filtered_df) > 0:
+            # Filtered status distribution and company activity
+            filtered_status_counts = filtered_df.groupby('status', sort=False, observed=True).size()
+            filtered_company_counts = filtered_df['company_name'].value_counts(sort=False)
+            filtered_view["fig_pie"] = build_status_pie(tuple(filtered_status_counts.items()))
+            filtered_view["fig_bar"] = build_company_bar(tuple(filtered_company_counts.items()))
+        analytics_cache["filtered_view"] = filtered_view
+    
+    filtered_df = filtered_view["df"]
     
     if len(filtered_df) > 0:
         # Filtered results visualization
         col1, col2 = st.columns(2)
         
         with col1:
-            # Filtered status distribution
-            filtered_status_counts = filtered_df['status'].value_counts()
-            fig_filtered_pie = px.pie(
-                values=filtered_status_counts.values,
-                names=filtered_status_counts.index,
-                title="Filtered Events - Status Distribution"
-            )
-            st.plotly_chart(fig_filtered_pie, use_container_width=True)
+            st.plotly_chart(filtered_view["fig_pie"], use_container_width=True)
         
         with col2:
-            # Filtered company activity
-            filtered_company_counts = filtered_df['company_name'].value_counts()
-            fig_filtered_bar = px.bar(
-                x=filtered_company_counts.values,
-                y=filtered_company_counts.index,
-                orientation='h',
-                title="Filtered Events - Company Activity"
-            )
-            st.plotly_chart(fig_filtered_bar, use_container_width=True)
+            st.plotly_chart(filtered_view["fig_bar"], use_container_width=True)
         
         # Filtered data table
         st.subheader("📋 Filtered Results")
@@ -2348,37 +2597,38 @@ elif page == "📊 Analytics":
     if st.session_state.agent_initialized:
         st.subheader("🤖 AI-Generated Insights")
         if st.button("🧠 Generate AI Analysis of Current Data", type="primary"):
-            analysis_prompt = f"""
-            Analyze the following corporate actions data and provide insights:
-            - Total events: {len(filtered_df)}
-            - Companies: {', '.join(selected_companies)}
-            - Event types: {', '.join(selected_types)}
-            - Statuses: {', '.join(selected_statuses)}
+            st.markdown("#### 🧠 AI Analysis Results")
             
-            Please provide:
-            1. Key trends and patterns
-            2. Risk assessments
-            3. Investment implications
-            4. Recommendations for further analysis            """
-            
-            with st.spinner("🤖 Azure AI Agent analyzing data..."):
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                response = loop.run_until_complete(
-                    agent_manager.send_message(analysis_prompt)
-                )
-                loop.close()
+            # Repeat clicks on an unchanged selection reuse the last analysis instead of re-asking the agent
+            analysis_key = (filter_key, len(filtered_df))
+            cached_analysis = analytics_cache.get("ai_analysis")
+            if cached_analysis is not None and cached_analysis["key"] == analysis_key:
+                st.markdown(cached_analysis["answer"])
+            else:
+                analysis_prompt = f"""
+                Analyze the following corporate actions data and provide insights:
+                - Total events: {len(filtered_df)}
+                - Companies: {', '.join(selected_companies)}
+                - Event types: {', '.join(selected_types)}
+                - Statuses: {', '.join(selected_statuses)}
                 
-                if response.get("success"):
-                    st.markdown("#### 🧠 AI Analysis Results")
-                    parsed = ast.literal_eval(response["answer"]) if isinstance(response["answer"], str) else response["answer"]
-                    # Verify if we have "value" key in parsed
-                    if "value" not in parsed:
-                        st.markdown(parsed)
+                Please provide:
+                1. Key trends and patterns
+                2. Risk assessments
+                3. Investment implications
+                4. Recommendations for further analysis            """
+                
+                analysis_placeholder = st.empty()
+                with st.spinner("🤖 Azure AI Agent analyzing data..."):
+                    response = run_async(
+                        agent_manager.send_message(analysis_prompt, placeholder=analysis_placeholder)
+                    )
+                    
+                    if response.get("success"):
+                        analysis_placeholder.markdown(response["answer"])
+                        analytics_cache["ai_analysis"] = {"key": analysis_key, "answer": response["answer"]}
                     else:
-                        st.markdown(parsed["value"])
-                else:
-                    st.error(f"❌ Analysis failed: {response.get('error', 'Unknown error')}")
+                        st.error(f"❌ Analysis failed: {response.get('error', 'Unknown error')}")
 
 # Settings page
 elif page == "⚙️ Settings":
@@ -2458,17 +2708,23 @@ elif page == "⚙️ Settings":
     if st.checkbox("🔧 Show Debug Information"):
         st.subheader("🔍 Debug Information")
         
+        # Only primitives are shown verbatim; managers, loops and DataFrames are summarized by type
+        safe_state = {
+            key: value if isinstance(value, (str, int, float, bool, type(None))) else f"<{type(value).__name__}>"
+            for key, value in st.session_state.items()
+        }
+        
         debug_info = {
             "Azure AI Config": AZURE_AI_CONFIG,
             "MCP Servers": MCP_SERVERS,
-            "Session State": dict(st.session_state),
+            "Session State": safe_state,
             "Available Dependencies": {
                 "Azure AI Projects": USE_AZURE_AI,
                 "MCP Python SDK": USE_MCP
             }
         }
         
-        st.json(debug_info)
+        st.json(debug_info, expanded=False)
         
         # Environment variables
         st.subheader("🌍 Environment Variables")
@@ -2479,6 +2735,9 @@ elif page == "⚙️ Settings":
         }
         st.json(env_vars)
 
+# Show status collected while running MCP tools for this page
+agent_manager.render_status_log()
+
 # Footer
 st.markdown("---")
 st.markdown("""
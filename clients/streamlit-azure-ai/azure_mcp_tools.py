@@ -6,15 +6,20 @@ Handles dynamic tool discovery, registration, and execution
 import asyncio
 import json
 import logging
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass
+from collections import deque
+from typing import Dict, List, Any, Optional, Callable, Tuple
+from dataclasses import dataclass, field
 
 try:
+    import httpx
     from mcp import ClientSession
     from mcp.client.streamable_http import streamablehttp_client
     MCP_AVAILABLE = True
+    # Failures raised before a request reached the server, so a retry cannot repeat its effect
+    MCP_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
 except ImportError:
     MCP_AVAILABLE = False
+    MCP_CONNECT_ERRORS = ()
 
 try:
     from azure.ai.agents.models import FunctionTool, ToolSet
@@ -24,15 +29,18 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(frozen=True)
 class MCPToolInfo:
     """Information about an MCP tool for Azure AI Agent registration"""
     server_name: str
     server_url: str
     tool_name: str
     description: str
-    input_schema: Dict[str, Any]
+    # Schemas are excluded from comparison so instances stay hashable
+    input_schema: Dict[str, Any] = field(compare=False)
     azure_function_name: str
+    # From the server's readOnlyHint annotation; only read-only tools are ever retried
+    read_only: bool = False
 
 class MCPToolRegistry:
     """Registry for managing MCP tools in Azure AI Agent Service"""
@@ -40,10 +48,80 @@ class MCPToolRegistry:
     def __init__(self):
         self.tools: Dict[str, MCPToolInfo] = {}
         self.server_connections: Dict[str, str] = {}
+        # Per server URL: (owner task, stop event, future resolving to the initialized session)
+        self._sessions: Dict[str, Tuple[asyncio.Task, asyncio.Event, asyncio.Future]] = {}
+        self._wrappers: Dict[str, Callable] = {}
         
     def add_server(self, name: str, url: str):
         """Add an MCP server to the registry"""
         self.server_connections[name] = url
+    
+    async def _own_session(self, server_url: str, ready: asyncio.Future, stop: asyncio.Event):
+        """Hold one server's session open until stopped, entering and exiting its contexts in this task as anyio requires"""
+        try:
+            async with streamablehttp_client(server_url) as (read_stream, write_stream, _):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    logger.debug(f"Opened pooled MCP session for {server_url}")
+                    ready.set_result(session)
+                    await stop.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+            raise
+        except Exception as e:
+            # Connect failures reach the callers waiting on ready; later failures just end the session
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.debug(f"MCP session for {server_url} closed with error: {e}")
+        finally:
+            pooled = self._sessions.get(server_url)
+            if pooled is not None and pooled[0] is asyncio.current_task():
+                del self._sessions[server_url]
+    
+    async def _get_session(self, server_url: str) -> "ClientSession":
+        """Get the pooled, initialized session for a server, connecting on first use"""
+        loop = asyncio.get_running_loop()
+        pooled = self._sessions.get(server_url)
+        if pooled is not None and pooled[0].get_loop() is not loop:
+            # Sessions belong to the loop that opened them; this loop gets its own
+            self._stop_on_owner_loop(pooled)
+            pooled = None
+        if pooled is None or pooled[0].done():
+            # No await between the check and the insert, so concurrent callers share one connect
+            ready = loop.create_future()
+            stop = asyncio.Event()
+            task = loop.create_task(self._own_session(server_url, ready, stop))
+            pooled = self._sessions[server_url] = (task, stop, ready)
+        # Shield so a cancelled caller does not cancel the connect other callers are waiting on
+        return await asyncio.shield(pooled[2])
+    
+    @staticmethod
+    def _stop_on_owner_loop(pooled: Tuple[asyncio.Task, asyncio.Event, asyncio.Future]):
+        """Ask a session owned by another event loop to close when that loop next runs"""
+        owner_loop = pooled[0].get_loop()
+        if not owner_loop.is_closed():
+            owner_loop.call_soon_threadsafe(pooled[1].set)
+    
+    async def _drop_session(self, server_url: str):
+        """Stop and forget the pooled session for a server, letting its owner task close it"""
+        pooled = self._sessions.pop(server_url, None)
+        if pooled is None:
+            return
+        task, stop, _ = pooled
+        if task.get_loop() is not asyncio.get_running_loop():
+            self._stop_on_owner_loop(pooled)
+            return
+        stop.set()
+        await asyncio.wait({task}, timeout=5)
+        if not task.done():
+            task.cancel()
+    
+    async def aclose(self):
+        """Close all pooled MCP sessions"""
+        for server_url in list(self._sessions):
+            await self._drop_session(server_url)
         
     async def discover_tools(self) -> List[MCPToolInfo]:
         """Discover all available tools from registered MCP servers"""
@@ -53,13 +131,19 @@ class MCPToolRegistry:
             logger.warning("MCP not available - cannot discover tools")
             return discovered_tools
             
-        for server_name, server_url in self.server_connections.items():
-            try:
-                server_tools = await self._discover_server_tools(server_name, server_url)
-                discovered_tools.extend(server_tools)
-                logger.info(f"Discovered {len(server_tools)} tools from {server_name}")
-            except Exception as e:
-                logger.error(f"Failed to discover tools from {server_name}: {e}")
+        # Query all servers concurrently so discovery costs max(RTT) rather than the sum
+        servers = list(self.server_connections.items())
+        results = await asyncio.gather(
+            *(self._discover_server_tools(server_name, server_url) for server_name, server_url in servers),
+            return_exceptions=True
+        )
+        
+        for (server_name, _), server_tools in zip(servers, results):
+            if isinstance(server_tools, Exception):
+                logger.error(f"Failed to discover tools from {server_name}: {server_tools}")
+                continue
+            discovered_tools.extend(server_tools)
+            logger.info(f"Discovered {len(server_tools)} tools from {server_name}")
                 
         return discovered_tools
     
@@ -68,29 +152,33 @@ class MCPToolRegistry:
         tools = []
         
         try:
-            async with streamablehttp_client(server_url) as (read_stream, write_stream, _):
-                async with ClientSession(read_stream, write_stream) as session:
-                    await session.initialize()
-                    
-                    # List available tools
-                    tools_result = await session.list_tools()
-                    
-                    for tool in tools_result.tools:
-                        azure_function_name = f"mcp_{server_name}_{tool.name}"
-                        
-                        tool_info = MCPToolInfo(
-                            server_name=server_name,
-                            server_url=server_url,
-                            tool_name=tool.name,
-                            description=tool.description or f"MCP tool: {tool.name}",
-                            input_schema=tool.inputSchema or {},
-                            azure_function_name=azure_function_name
-                        )
-                        
-                        tools.append(tool_info)
-                        self.tools[azure_function_name] = tool_info
-                        
+            session = await self._get_session(server_url)
+            
+            # List available tools
+            tools_result = await session.list_tools()
+            
+            for tool in tools_result.tools:
+                azure_function_name = f"mcp_{server_name}_{tool.name}"
+                input_schema = tool.inputSchema or {}
+                
+                tool_info = MCPToolInfo(
+                    server_name=server_name,
+                    server_url=server_url,
+                    tool_name=tool.name,
+                    description=tool.description or f"MCP tool: {tool.name}",
+                    input_schema=input_schema,
+                    azure_function_name=azure_function_name,
+                    read_only=bool(getattr(getattr(tool, "annotations", None), "readOnlyHint", False))
+                )
+                
+                tools.append(tool_info)
+                if self.tools.get(azure_function_name) != tool_info:
+                    # Tool moved or changed; its cached wrapper closes over stale info
+                    self._wrappers.pop(azure_function_name, None)
+                self.tools[azure_function_name] = tool_info
+                
         except Exception as e:
+            await self._drop_session(server_url)
             logger.error(f"Error discovering tools from {server_name}: {e}")
             
         return tools
@@ -109,15 +197,10 @@ class MCPToolRegistry:
         
         for tool_name, tool_info in self.tools.items():
             try:
-                # Create function schema for Azure AI Agent
-                function_schema = {
-                    "name": tool_name,
-                    "description": tool_info.description,
-                    "parameters": self._convert_mcp_schema_to_openai(tool_info.input_schema)
-                }
-                
-                # Create wrapper function for execution
-                wrapper_function = self._create_tool_wrapper(tool_info)
+                # Reuse the wrapper across toolset rebuilds so its identity is stable
+                wrapper_function = self._wrappers.get(tool_name)
+                if wrapper_function is None:
+                    wrapper_function = self._wrappers[tool_name] = self._create_tool_wrapper(tool_info)
                 
                 # Create Azure AI FunctionTool
                 function_tool = FunctionTool(
@@ -180,27 +263,35 @@ class MCPToolRegistry:
             return "MCP not available - cannot execute tool"
             
         try:
-            async with streamablehttp_client(tool_info.server_url) as (read_stream, write_stream, _):
-                async with ClientSession(read_stream, write_stream) as session:
-                    await session.initialize()
-                    
-                    # Call the MCP tool
-                    result = await session.call_tool(tool_info.tool_name, arguments)
-                    
-                    # Extract text content from MCP result
-                    if hasattr(result, 'content') and result.content:
-                        # Handle multiple content blocks
-                        content_parts = []
-                        for content_block in result.content:
-                            if hasattr(content_block, 'text'):
-                                content_parts.append(content_block.text)
-                            else:
-                                content_parts.append(str(content_block))
-                        return "\n".join(content_parts)
-                    else:
-                        return str(result)
-                        
+            session = await self._get_session(tool_info.server_url)
+            try:
+                result = await session.call_tool(tool_info.tool_name, arguments)
+            except Exception as e:
+                # The pooled session may be broken; the next call reconnects
+                await self._drop_session(tool_info.server_url)
+                # Retry once only when the request never reached the server and repeating it is harmless
+                if not tool_info.read_only or not isinstance(e, MCP_CONNECT_ERRORS):
+                    raise
+                logger.debug(f"Reconnecting to {tool_info.server_url} after error: {e}")
+                session = await self._get_session(tool_info.server_url)
+                result = await session.call_tool(tool_info.tool_name, arguments)
+            
+            # Extract text content from MCP result
+            if hasattr(result, 'content') and result.content:
+                # Single text blocks (the common case) are returned without copying
+                if len(result.content) == 1 and hasattr(result.content[0], 'text'):
+                    return result.content[0].text
+                
+                # Handle multiple content blocks
+                return "\n".join(
+                    content_block.text if hasattr(content_block, 'text') else str(content_block)
+                    for content_block in result.content
+                )
+            else:
+                return str(result)
+                
         except Exception as e:
+            await self._drop_session(tool_info.server_url)
             logger.error(f"MCP tool execution failed for {tool_info.tool_name}: {e}")
             raise
     
@@ -225,16 +316,16 @@ class ToolExecutionTracker:
         
     def record_execution(self, tool_name: str, success: bool, duration: float, error: str = None):
         """Record tool execution statistics"""
-        if tool_name not in self.execution_stats:
-            self.execution_stats[tool_name] = {
+        stats = self.execution_stats.get(tool_name)
+        if stats is None:
+            # Build the entry only on a tool's first call
+            stats = self.execution_stats[tool_name] = {
                 "total_calls": 0,
                 "successful_calls": 0,
                 "failed_calls": 0,
                 "total_duration": 0.0,
-                "errors": []
+                "errors": deque(maxlen=10)  # Keep last 10 errors
             }
-            
-        stats = self.execution_stats[tool_name]
         stats["total_calls"] += 1
         stats["total_duration"] += duration
         
@@ -242,27 +333,31 @@ class ToolExecutionTracker:
             stats["successful_calls"] += 1
         else:
             stats["failed_calls"] += 1
-            if error and len(stats["errors"]) < 10:  # Keep last 10 errors
+            if error:
                 stats["errors"].append(error)
                 
     def get_tool_stats(self, tool_name: str) -> Dict[str, Any]:
         """Get statistics for a specific tool"""
-        if tool_name not in self.execution_stats:
+        stats = self.execution_stats.get(tool_name)
+        if stats is None:
             return {}
             
-        stats = self.execution_stats[tool_name]
-        
+        return self._summarize(tool_name, stats)
+    
+    @staticmethod
+    def _summarize(tool_name: str, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Derive the reported statistics from a tool's running totals"""
         return {
             "tool_name": tool_name,
             "total_calls": stats["total_calls"],
             "success_rate": stats["successful_calls"] / stats["total_calls"] if stats["total_calls"] > 0 else 0,
             "average_duration": stats["total_duration"] / stats["total_calls"] if stats["total_calls"] > 0 else 0,
-            "recent_errors": stats["errors"][-5:]  # Last 5 errors
+            "recent_errors": list(stats["errors"])[-5:]  # Last 5 errors
         }
     
     def get_all_stats(self) -> Dict[str, Any]:
         """Get statistics for all tools"""
-        return {tool_name: self.get_tool_stats(tool_name) for tool_name in self.execution_stats.keys()}
+        return {tool_name: self._summarize(tool_name, stats) for tool_name, stats in self.execution_stats.items()}
 
 # Utility functions for common tool operations
 def create_default_registry() -> MCPToolRegistry:
@@ -4,43 +4,159 @@ Interactive dashboard for market participants using MCP protocol
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import json
 import asyncio
 import threading
+import atexit
+import copy
+import functools
+import itertools
+import concurrent.futures
 from datetime import datetime, timedelta, date
-from typing import List, Dict, Any, Optional
+from collections import Counter, deque
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 import sys
-import io
-import contextlib
 from streamlit_modal import Modal
 import uuid
-# Add dynamic code execution imports
-import subprocess
-import tempfile
 import os
+import re
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+if TYPE_CHECKING:
+    import pandas as pd
 
 # MCP Client import - Using official MCP Python SDK
 try:
+    import httpx
     from mcp import ClientSession
     from mcp.client.streamable_http import streamablehttp_client
     import asyncio
     USE_MCP = True
+    # Failures raised before a request reached the server, so a retry cannot repeat its effect
+    MCP_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
 except ImportError:
     USE_MCP = False
+    MCP_CONNECT_ERRORS = ()
     st.warning("MCP Python SDK not available. Using sample data.")
 
+# Fast JSON parsing for MCP tool payloads
+try:
+    import orjson
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
+
+def loads_json(data):
+    """Parse a JSON payload with orjson when available; errors are json.JSONDecodeError subclasses"""
+    if USE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps_json(obj, sort_keys: bool = False) -> str:
+    """Serialize a tool argument payload to a JSON string with orjson when available"""
+    if USE_ORJSON:
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS if sort_keys else 0
+        return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+    return json.dumps(obj, sort_keys=sort_keys, default=str)
+
 # MCP Server URLs (FastMCP servers accessed via official MCP Python SDK client)
 MCP_SERVERS = {
     "rag": "http://localhost:8000/mcp",
     "websearch": "http://localhost:8001/mcp"
 }
 
+# Health check tool exposed by each MCP server
+HEALTH_CHECK_TOOLS = {
+    "rag": "get_service_health",
+    "websearch": "get_search_health"
+}
+
+# Seconds to wait for a tool result; health probes fail fast so a down server cannot stall the page
+MCP_CALL_TIMEOUT = 30.0
+HEALTH_CHECK_TIMEOUT = 5.0
+
+# Keep-alive pool shared by every MCP session the client opens
+MCP_HTTP_LIMITS = {
+    "max_keepalive_connections": 32,
+    "max_connections": 32,
+    "keepalive_expiry": 300
+}
+MCP_HTTP_TIMEOUT = {"timeout": 30.0, "connect": 3.0}
+
+# Read-only tools whose identical in-flight calls share a single request
+COALESCED_TOOLS = frozenset({
+    "search_corporate_actions", "web_search", "news_search", "financial_data_search",
+    "get_service_health", "get_search_health", "get_subscription_tool",
+    "get_upcoming_events_tool", "get_inquiries_tool", "get_user_inquiries_tool"
+})
+
+# Tools without side effects; only these are retried after a connection failure
+READ_ONLY_TOOLS = COALESCED_TOOLS | {"rag_query", "rag_query_subscribed", "check_container_status"}
+
+if USE_MCP:
+    class PooledMCPTransport(httpx.AsyncBaseTransport):
+        """Forward MCP session requests to a shared connection pool that outlives the session"""
+        
+        def __init__(self, transport: httpx.AsyncBaseTransport):
+            self.transport = transport
+        
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            return await self.transport.handle_async_request(request)
+        
+        async def aclose(self) -> None:
+            # streamablehttp_client closes its client after every session; keep the pool open
+            pass
+
+# Inquiry card badge colors (Streamlit markdown color names) and page size
+INQUIRY_PRIORITY_COLORS = {
+    "LOW": "green",
+    "MEDIUM": "orange",
+    "HIGH": "red",
+    "URGENT": "red"
+}
+INQUIRY_STATUS_COLORS = {
+    "OPEN": "blue",
+    "ACKNOWLEDGED": "gray",
+    "IN_REVIEW": "blue",
+    "RESPONDED": "green",
+    "ESCALATED": "red",
+    "RESOLVED": "green",
+    "CLOSED": "gray"
+}
+INQUIRIES_PER_PAGE = 20
+
+# RAG assistant chat keeps only the most recent messages
+CHAT_HISTORY_MAX_MESSAGES = 40
+
+# Event status presentation shared by the results tables and event lists
+STATUS_EMOJI = {"confirmed": "✅", "announced": "📅", "pending": "⏳", "processed": "✅", "cancelled": "❌"}
+STATUS_CELL_STYLES = {
+    "confirmed": "background-color: #d4edda; color: #155724; font-weight: bold;",
+    "announced": "background-color: #fff3cd; color: #856404; font-weight: bold;",
+    "pending": "background-color: #f8d7da; color: #721c24; font-weight: bold;",
+    "processed": "background-color: #d1ecf1; color: #0c5460; font-weight: bold;"
+}
+DEFAULT_STATUS_CELL_STYLE = "background-color: #e2e3e5; color: #383d41; font-weight: bold;"
+
+# Columns shown in event tables, in display order, with their headers
+EVENT_TABLE_COLUMNS = {
+    "company_name": "Company",
+    "symbol": "Symbol",
+    "event_type": "Event Type",
+    "status": "Status",
+    "announcement_date": "Announced"
+}
+
+def build_event_table(events: List[Dict[str, Any]]) -> "pd.DataFrame":
+    """Project normalized events straight into the display columns, without an intermediate full frame"""
+    import pandas as pd
+    df = pd.DataFrame.from_records(events, columns=list(EVENT_TABLE_COLUMNS))
+    df.columns = list(EVENT_TABLE_COLUMNS.values())
+    return df
+
+def style_status_column(col):
+    """Pandas Styler.apply callback coloring a whole status column with one vectorized lookup"""
+    return col.map(STATUS_CELL_STYLES).fillna(DEFAULT_STATUS_CELL_STYLE)
+
 # Page configuration
 st.set_page_config(
     page_title="Corporate Actions Dashboard - MCP",
@@ -65,58 +181,235 @@ class SimpleMCPClient:
     
     def __init__(self):
         self.servers = MCP_SERVERS
-    async def _call_tool_async(self, server_url: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Call a tool on MCP server using official MCP Client"""
+        # One long-lived event loop on a daemon thread serves every tool call
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, name="mcp-client-loop", daemon=True)
+        self._loop_thread.start()
+        # Every session reuses warm keep-alive connections; connect failures are retried
+        self._transport = PooledMCPTransport(httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(**MCP_HTTP_LIMITS),
+            retries=3
+        ))
+        # In-flight read-only calls keyed by (server_url, tool_name, arguments JSON)
+        # Each entry is [shared future, number of callers still waiting on it]
+        self._inflight: Dict[tuple, list] = {}
+        self._inflight_lock = threading.Lock()
+        # One (owner task, stop event, ready future) per server URL, living on the background loop
+        self._sessions: Dict[str, tuple] = {}
+        atexit.register(self.close)
+    
+    def _http_client_factory(self, headers=None, timeout=None, auth=None):
+        """Build the httpx client used by streamablehttp_client on top of the shared pool"""
+        return httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout if timeout is not None else httpx.Timeout(**MCP_HTTP_TIMEOUT),
+            auth=auth,
+            follow_redirects=True,
+            transport=self._transport
+        )
+    
+    def close(self):
+        """Close pooled connections and stop the background event loop"""
+        if self._loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(self._close_sessions(), self._loop).result(timeout=5)
+                asyncio.run_coroutine_threadsafe(self._transport.transport.aclose(), self._loop).result(timeout=5)
+            except Exception:
+                pass
+            self._loop.call_soon_threadsafe(self._loop.stop)
+    
+    @staticmethod
+    def _result_text(result) -> Any:
+        """Extract text content from an MCP tool result"""
+        if hasattr(result, 'content') and result.content:
+            # Get the first content block (should be text)
+            first_content = result.content[0]
+            if hasattr(first_content, 'text'):
+                return first_content.text
+            else:
+                return str(first_content)
+        else:
+            return str(result)
+    
+    async def _own_session(self, server_url: str, ready: asyncio.Future, stop: asyncio.Event):
+        """Hold one server's session open until stopped, entering and exiting its contexts in this task as anyio requires"""
         try:
-            async with streamablehttp_client(server_url) as (read_stream, write_stream, _):
+            async with streamablehttp_client(
+                server_url, httpx_client_factory=self._http_client_factory
+            ) as (read_stream, write_stream, _):
                 async with ClientSession(read_stream, write_stream) as session:
-                    # Initialize the connection
                     await session.initialize()
-                    
-                    # Call the tool
-                    result = await session.call_tool(tool_name, arguments)
-                    
-                    # Extract text content from MCP result
-                    if hasattr(result, 'content') and result.content:
-                        # Get the first content block (should be text)
-                        first_content = result.content[0]
-                        if hasattr(first_content, 'text'):
-                            return first_content.text
-                        else:
-                            return str(first_content)
-                    else:
-                        return str(result)
+                    ready.set_result(session)
+                    await stop.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+            raise
         except Exception as e:
-            return {"error": f"MCP error: {str(e)}"}
+            # Connect failures reach the callers waiting on ready; later failures just end the session
+            if not ready.done():
+                ready.set_exception(e)
+        finally:
+            pooled = self._sessions.get(server_url)
+            if pooled is not None and pooled[0] is asyncio.current_task():
+                del self._sessions[server_url]
+    
+    async def _get_session(self, server_url: str) -> "ClientSession":
+        """Get the pooled, initialized session for a server, connecting on first use"""
+        pooled = self._sessions.get(server_url)
+        if pooled is None or pooled[0].done():
+            # No await between the check and the insert, so concurrent callers share one connect
+            ready = self._loop.create_future()
+            stop = asyncio.Event()
+            task = self._loop.create_task(self._own_session(server_url, ready, stop))
+            pooled = self._sessions[server_url] = (task, stop, ready)
+        # Shield so a caller timing out does not cancel the connect other callers are waiting on
+        return await asyncio.shield(pooled[2])
+    
+    async def _drop_session(self, server_url: str):
+        """Stop and forget the pooled session for a server, letting its owner task close it"""
+        pooled = self._sessions.pop(server_url, None)
+        if pooled is not None:
+            task, stop, _ = pooled
+            stop.set()
+            await asyncio.wait({task}, timeout=5)
+            if not task.done():
+                task.cancel()
+    
+    async def _close_sessions(self):
+        """Close all pooled MCP sessions"""
+        for server_url in list(self._sessions):
+            await self._drop_session(server_url)
     
-    def _call_tool(self, server_url: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Synchronous wrapper for async tool calls"""
-        import threading
-        
-        def run_async_in_thread():
-            """Run async call in a separate thread with its own event loop"""
+    async def _call_tool_async(self, server_url: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a tool on MCP server using official MCP Client"""
+        try:
+            session = await self._get_session(server_url)
             try:
-                # Create a new event loop for this thread
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    return loop.run_until_complete(self._call_tool_async(server_url, tool_name, arguments))
-                finally:
-                    loop.close()
+                result = await session.call_tool(tool_name, arguments)
             except Exception as e:
-                return {"error": f"Thread execution error: {str(e)}"}
+                # The pooled session may be broken; the next call reconnects
+                await self._drop_session(server_url)
+                # Retry once only when the request never reached the server and repeating it is harmless
+                if tool_name not in READ_ONLY_TOOLS or not isinstance(e, MCP_CONNECT_ERRORS):
+                    raise
+                session = await self._get_session(server_url)
+                result = await session.call_tool(tool_name, arguments)
+            return self._result_text(result)
+        except Exception as e:
+            return {"error": f"MCP error: {str(e)}"}
+    
+    async def _call_server_tools_async(self, server_url: str, calls: List[tuple]) -> List[Any]:
+        """Call several (tool_name, arguments) pairs concurrently over the server's pooled session"""
+        try:
+            session = await self._get_session(server_url)
+        except Exception as e:
+            return [{"error": f"MCP error: {str(e)}"}] * len(calls)
+        
+        results = await asyncio.gather(
+            *(session.call_tool(tool_name, arguments) for tool_name, arguments in calls),
+            return_exceptions=True
+        )
+        if any(isinstance(result, Exception) for result in results):
+            # Evict the session so the next call reconnects instead of reusing a broken one
+            await self._drop_session(server_url)
         
+        return [
+            {"error": f"MCP error: {str(result)}"} if isinstance(result, Exception) else self._result_text(result)
+            for result in results
+        ]
+    
+    def _call_tool(self, server_url: str, tool_name: str, arguments: Dict[str, Any],
+                   timeout: float = MCP_CALL_TIMEOUT) -> Dict[str, Any]:
+        """Synchronous wrapper for async tool calls"""
+        key = None
+        if tool_name in COALESCED_TOOLS:
+            key = (server_url, tool_name, dumps_json(arguments, sort_keys=True))
+        
+        # Sessions asking for the same read while it is in flight wait on one shared future
+        with self._inflight_lock:
+            entry = self._inflight.get(key) if key is not None else None
+            published = entry is None and key is not None
+            if entry is None:
+                entry = [asyncio.run_coroutine_threadsafe(
+                    self._call_tool_async(server_url, tool_name, arguments), self._loop
+                ), 0]
+                if published:
+                    self._inflight[key] = entry
+            entry[1] += 1
+        future = entry[0]
+        if published:
+            # Registered outside the lock: an already-finished future runs the callback right here
+            future.add_done_callback(lambda _, key=key, entry=entry: self._pop_inflight(key, entry))
         try:
-            # Always run in a separate thread to avoid event loop conflicts
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(run_async_in_thread)
-                result = future.result(timeout=30)
-                return result
+            return future.result(timeout=timeout)
         except concurrent.futures.TimeoutError:
-            return {"error": "Request timed out after 30 seconds"}
+            return {"error": f"Request timed out after {timeout:g} seconds"}
         except Exception as e:
             return {"error": f"Execution error: {str(e)}"}
+        finally:
+            with self._inflight_lock:
+                entry[1] -= 1
+                # Only the last waiter gives up on the call; others sharing it keep their own timeouts
+                abandoned = entry[1] == 0 and not future.done()
+                if abandoned and self._inflight.get(key) is entry:
+                    # Unpublish before cancelling so no new caller joins a call about to be cancelled
+                    del self._inflight[key]
+            if abandoned:
+                future.cancel()
+    
+    def _pop_inflight(self, key: tuple, entry: list):
+        """Forget a finished in-flight call unless a newer call already replaced it"""
+        with self._inflight_lock:
+            if self._inflight.get(key) is entry:
+                del self._inflight[key]
+    
+    def _call_tools(self, calls: List[tuple], timeout: float = MCP_CALL_TIMEOUT) -> List[Any]:
+        """Run several (server_url, tool_name, arguments) calls concurrently, returning results in order"""
+        # Calls to the same server share one session; different servers run side by side
+        batches: Dict[str, List[int]] = {}
+        for index, (server_url, _, _) in enumerate(calls):
+            batches.setdefault(server_url, []).append(index)
+        
+        futures = {
+            asyncio.run_coroutine_threadsafe(
+                self._call_server_tools_async(server_url, [calls[i][1:] for i in indices]), self._loop
+            ): indices
+            for server_url, indices in batches.items()
+        }
+        # All batches share one timeout budget, so wall time is the slowest call rather than the sum
+        done, not_done = concurrent.futures.wait(futures, timeout=timeout)
+        for future in not_done:
+            future.cancel()
+        
+        results: List[Any] = [None] * len(calls)
+        for future, indices in futures.items():
+            if future in not_done:
+                batch_results = [{"error": f"Request timed out after {timeout:g} seconds"}] * len(indices)
+            else:
+                try:
+                    batch_results = future.result()
+                except Exception as e:
+                    batch_results = [{"error": f"Execution error: {str(e)}"}] * len(indices)
+            for index, result in zip(indices, batch_results):
+                results[index] = result
+        return results
+    
+    @staticmethod
+    def _parse_result(result, default) -> Dict[str, Any]:
+        """Parse a tool's JSON text; default is a dict, or a callable given the raw text, used when parsing fails"""
+        # If result is a string (successful), parse as JSON
+        if isinstance(result, str):
+            try:
+                return loads_json(result)
+            except:
+                return default(result) if callable(default) else default
+        # If result is a dict, it's an error response
+        return result
+    
+    def _invoke(self, server_name: str, tool_name: str, arguments: Dict[str, Any], default) -> Dict[str, Any]:
+        """Call a tool on a named server and parse its result"""
+        return self._parse_result(self._call_tool(self.servers[server_name], tool_name, arguments), default)
     
     def rag_query(self, query: str, max_results: int = 5, chat_history: List[Dict[str, str]] = None) -> Dict[str, Any]:
         """Query the RAG server with chat history support"""
@@ -124,126 +417,67 @@ class SimpleMCPClient:
         history_json = ""
         if chat_history:
             try:
-                history_json = json.dumps(chat_history)
+                history_json = dumps_json(chat_history)
             except:
                 history_json = ""
         
-        result = self._call_tool(
-            self.servers['rag'],
-            "rag_query",
-            {
-                "query": query,
-                "max_results": max_results,
-                "chat_history": history_json
-            }
+        return self._invoke(
+            'rag', "rag_query",
+            {"query": query, "max_results": max_results, "chat_history": history_json},
+            lambda text: {"answer": text}
         )
-        # If result is a string (successful), parse as JSON
-        if isinstance(result, str):
-            try:
-                return json.loads(result)
-            except:
-                return {"answer": result}
-        # If result is a dict, it's an error response
-        return result
     
     def search_corporate_actions(self, **kwargs) -> Dict[str, Any]:
         """Search corporate actions"""
-        result = self._call_tool(self.servers['rag'], "search_corporate_actions", kwargs)
-        # If result is a string (successful), parse as JSON
-        if isinstance(result, str):
-            try:
-                return json.loads(result)
-            except:
-                return {"events": [], "total_count": 0}
-        # If result is a dict, it's an error response
-        return result
+        return self._invoke('rag', "search_corporate_actions", kwargs, {"events": [], "total_count": 0})
+    
     def web_search(self, query: str, result_count: int = 10) -> Dict[str, Any]:
         """Web search"""
-        result = self._call_tool(
-            self.servers['websearch'],
-            "web_search",
-            {
-                "query": query,
-                "max_results": result_count
-            }
-        )
-        # If result is a string (successful), parse as JSON
-        if isinstance(result, str):
-            try:
-                return json.loads(result)
-            except:
-                return {"results": []}
-        # If result is a dict, it's an error response
-        return result
+        return self._invoke('websearch', "web_search", {"query": query, "max_results": result_count}, {"results": []})
     
     def news_search(self, query: str, result_count: int = 10) -> Dict[str, Any]:
         """News search"""
-        result = self._call_tool(
-            self.servers['websearch'],
-            "news_search",
-            {
-                "query": query,
-                "max_results": result_count
-            }
-        )
-        # If result is a string (successful), parse as JSON
-        if isinstance(result, str):
-            try:
-                return json.loads(result)
-            except:
-                return {"results": []}
-        # If result is a dict, it's an error response
-        return result
+        return self._invoke('websearch', "news_search", {"query": query, "max_results": result_count}, {"results": []})
     
     def financial_data_search(self, symbol: str, data_type: str = "overview") -> Dict[str, Any]:
         """Financial data search"""
-        result = self._call_tool(
-            self.servers['websearch'],
-            "financial_data_search",
-            {
-                "symbol": symbol,
-                "data_type": data_type
-            }
+        return self._invoke(
+            'websearch', "financial_data_search", {"symbol": symbol, "data_type": data_type}, {"results": []}
         )
-        # If result is a string (successful), parse as JSON
-        if isinstance(result, str):
-            try:
-                return json.loads(result)
-            except:                return {"results": []}
-        # If result is a dict, it's an error response
-        return result
-                
+    
+    @classmethod
+    def _parse_health(cls, result) -> Dict[str, Any]:
+        """Parse a health check result, passing error dicts through"""
+        return cls._parse_result(result, lambda text: {"status": "ok", "response": text})
+    
     def check_server_health(self, server_name: str) -> Dict[str, Any]:
         """Check health of a specific MCP server"""
         if server_name not in self.servers:
             return {"error": f"Unknown server: {server_name}"}
         
-        server_url = self.servers[server_name]
-        
         # Test with appropriate health check tool for each server
-        if server_name == 'rag':
-            result = self._call_tool(server_url, "get_service_health", {})
-        elif server_name == 'websearch':
-            result = self._call_tool(server_url, "get_search_health", {})
-        else:
+        tool_name = HEALTH_CHECK_TOOLS.get(server_name)
+        if tool_name is None:
             return {"error": f"No health check defined for server: {server_name}"}
         
-        # Parse JSON result if it's a string
-        if isinstance(result, str):
-            try:
-                return json.loads(result)
-            except:
-                return {"status": "ok", "response": result}
-        # If result is a dict, return as-is (likely an error)
-        return result
+        return self._parse_health(
+            self._call_tool(self.servers[server_name], tool_name, {}, timeout=HEALTH_CHECK_TIMEOUT)
+        )
+    
+    def check_all_health(self) -> Dict[str, Dict[str, Any]]:
+        """Check every MCP server concurrently, keyed by server name"""
+        names = [name for name in self.servers if name in HEALTH_CHECK_TOOLS]
+        results = self._call_tools(
+            [(self.servers[name], HEALTH_CHECK_TOOLS[name], {}) for name in names], timeout=HEALTH_CHECK_TIMEOUT
+        )
+        return {name: self._parse_health(result) for name, result in zip(names, results)}
 
     # Inquiry Management Functions
     def create_inquiry(self, event_id: str, user_id: str, user_name: str, organization: str, 
                         subject: str, description: str, priority: str = "MEDIUM") -> Dict[str, Any]:
         """Create a new inquiry using MCP client"""
-        result = self._call_tool(
-            self.servers['rag'],
-            "create_inquiry_tool",
+        return self._invoke(
+            'rag', "create_inquiry_tool",
             {
                 "event_id": event_id,
                 "user_id": user_id,
@@ -252,89 +486,33 @@ class SimpleMCPClient:
                 "subject": subject,
                 "description": description,
                 "priority": priority
-            }
+            },
+            {"success": False, "error": "Failed to parse response"}
         )
-        # If result is a string (successful), parse as JSON
-        if isinstance(result, str):
-            try:
-                return json.loads(result)
-            except:
-                return {"success": False, "error": "Failed to parse response"}
-        # If result is a dict, it's an error response
-        return result
 
     def get_inquiries(self, event_id: str) -> Dict[str, Any]:
         """Get all inquiries for a specific event"""
-        result = self._call_tool(
-            self.servers['rag'],
-            "get_inquiries_tool",
-            {"event_id": event_id}
-        )
-        # If result is a string (successful), parse as JSON
-        if isinstance(result, str):
-            try:
-                return json.loads(result)
-            except:
-                return {"inquiries": [], "count": 0}
-        # If result is a dict, it's an error response
-        return result
+        return self._invoke('rag', "get_inquiries_tool", {"event_id": event_id}, {"inquiries": [], "count": 0})
 
     def get_user_inquiries(self, event_id: str, user_id: str) -> Dict[str, Any]:
         """Get user's inquiries for a specific event"""
-        result = self._call_tool(
-            self.servers['rag'],
-            "get_user_inquiries_tool",
-            {
-                "event_id": event_id,
-                "user_id": user_id
-            }
+        return self._invoke(
+            'rag', "get_user_inquiries_tool", {"event_id": event_id, "user_id": user_id}, {"inquiries": [], "count": 0}
         )
-        # If result is a string (successful), parse as JSON
-        if isinstance(result, str):
-            try:
-                return json.loads(result)
-            except:
-                return {"inquiries": [], "count": 0}
-        # If result is a dict, it's an error response
-        return result
 
     def update_inquiry(self, inquiry_id: str, **updates) -> Dict[str, Any]:
         """Update an existing inquiry"""
-        result = self._call_tool(
-            self.servers['rag'],
-            "update_inquiry_tool",
-            {
-                "inquiry_id": inquiry_id,
-                **updates
-            }
+        return self._invoke(
+            'rag', "update_inquiry_tool", {"inquiry_id": inquiry_id, **updates},
+            {"success": False, "error": "Failed to parse response"}
         )
-        # If result is a string (successful), parse as JSON
-        if isinstance(result, str):
-            try:
-                return json.loads(result)
-            except:
-                return {"success": False, "error": "Failed to parse response"}
-        # If result is a dict, it's an error response
-        return result
 
     def delete_inquiry(self, inquiry_id: str, user_id: str) -> Dict[str, Any]:
         """Delete an inquiry (user's own only)"""
-        result = self._call_tool(
-            self.servers['rag'],
-            "delete_inquiry_tool",
-            {
-                "inquiry_id": inquiry_id,
-                "user_id": user_id
-            }
+        return self._invoke(
+            'rag', "delete_inquiry_tool", {"inquiry_id": inquiry_id, "user_id": user_id},
+            {"success": False, "error": "Failed to parse response"}
         )
-        # If result is a string (successful), parse as JSON
-        if isinstance(result, str):
-            try:
-                return json.loads(result)
-            except:
-                return {"success": False, "error": "Failed to parse response"}
-        # If result is a dict, it's an error response
-        return result
 
 # Initialize client
 @st.cache_resource
@@ -348,6 +526,62 @@ def get_client():
             return None
     return None
 
+class MCPToolError(Exception):
+    """Raised inside cached fetchers so failed tool calls are never memoized"""
+    
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__(result["error"])
+        self.result = result
+
+def fetch_cached(fetcher, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Call a cached MCP fetcher with hashable params, returning tool errors as an error dict"""
+    try:
+        return fetcher(tuple(sorted(params.items())))
+    except MCPToolError as e:
+        return e.result
+
+def _raise_on_tool_error(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn an MCP error dict into an exception so st.cache_data skips it"""
+    if isinstance(result, dict) and "error" in result:
+        raise MCPToolError(result)
+    return result
+
+# Read-only MCP lookups are memoized per argument tuple; reruns reuse the parsed response
+@st.cache_data(ttl=15, show_spinner=False)
+def fetch_search(params: tuple) -> Dict[str, Any]:
+    """Search corporate actions"""
+    return _raise_on_tool_error(client.search_corporate_actions(**dict(params)))
+
+@st.cache_data(ttl=120, show_spinner=False)
+def fetch_analytics_events(params: tuple) -> Dict[str, Any]:
+    """Search corporate actions for the analytics page, which tolerates staler data"""
+    result = _raise_on_tool_error(client.search_corporate_actions(**dict(params)))
+    # Normalize once here so reruns get cached, already-normalized events
+    result["events"] = normalize_event_data(result.get("events", []))
+    return result
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_rag_answer(params: tuple) -> Dict[str, Any]:
+    """RAG answer for a question, keyed on the recent chat history it was asked with"""
+    return _raise_on_tool_error(client.rag_query(**dict(params)))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_web_search(params: tuple) -> Dict[str, Any]:
+    """Web search"""
+    return _raise_on_tool_error(client.web_search(**dict(params)))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_news_search(params: tuple) -> Dict[str, Any]:
+    """News search"""
+    return _raise_on_tool_error(client.news_search(**dict(params)))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_financial_data(params: tuple) -> Dict[str, Any]:
+    """Financial data search"""
+    return _raise_on_tool_error(client.financial_data_search(**dict(params)))
+
+# Shared by every session; the refresh button clears it
+@st.cache_data(ttl=300, show_spinner=False)
 def check_server_status():
     """Check the status of MCP servers using official MCP Python SDK client - cached for performance"""
     if not client:
@@ -356,240 +590,66 @@ def check_server_status():
             "message": "MCP client not available. Check if MCP Python SDK library is installed."
         }
     
-    # Use session state to cache server status for 5 minutes
-    cache_duration = 300  # 5 minutes in seconds
-    current_time = datetime.now().timestamp()
-    
-    if "server_status_cache" in st.session_state:
-        cache_time = st.session_state.server_status_cache.get("timestamp", 0)
-        if current_time - cache_time < cache_duration:
-            return st.session_state.server_status_cache["status"]
-    
     # Check server status
     try:
-        # Quick health check on just one server to avoid multiple slow checks
-        result = client.check_server_health('rag')
-        #print(f"RAG Server Health Check: {result}")
-        if "error" in result:
+        # All servers are checked at once, so this costs one round trip rather than one per server
+        results = client.check_all_health()
+        errors = {name: result["error"] for name, result in results.items() if "error" in result}
+        if errors:
             status = {
                 "status": "disconnected", 
-                "message": f"MCP servers not responding: {result['error']}. Please start with: python start_mcp_servers.py"
+                "message": f"MCP servers not responding: {'; '.join(f'{name}: {error}' for name, error in errors.items())}. Please start with: python start_mcp_servers.py"
             }
         else:
             status = {
                 "status": "connected",
                 "message": "Connected to MCP servers successfully"
             }
+        status["servers"] = {name: name not in errors for name in results}
     except Exception as e:
         status = {
             "status": "error",
             "message": f"Error connecting to MCP servers: {str(e)}. Start with: python start_mcp_servers.py"
         }
     
-    # Cache the result
-    st.session_state.server_status_cache = {
-        "status": status,
-        "timestamp": current_time
-    }
-    
     return status
 
 client = get_client()
 
-# Custom CSS for enhanced dashboard styling
-st.markdown("""
-<style>
-    .main-header {
-        background: linear-gradient(90deg, #1f4e79, #2e6da4);
-        padding: 1rem;
-        border-radius: 10px;
-        color: white;
-        margin-bottom: 2rem;
-    }
-    .metric-card {
-        background: #f8f9fa;
-        padding: 1rem;
-        border-radius: 10px;
-        border-left: 4px solid #007bff;
-        margin: 0.5rem 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .status-confirmed { 
-        background: #d4edda !important; 
-        color: #155724 !important; 
-        font-weight: bold !important;
-        border-radius: 5px !important;
-        padding: 5px 10px !important;
-    }
-    .status-announced { 
-        background: #fff3cd !important; 
-        color: #856404 !important; 
-        font-weight: bold !important;
-        border-radius: 5px !important;
-        padding: 5px 10px !important;
-    }
-    .status-pending { 
-        background: #f8d7da !important; 
-        color: #721c24 !important; 
-        font-weight: bold !important;
-        border-radius: 5px !important;
-        padding: 5px 10px !important;
-    }
-    .status-processed { 
-        background: #d1ecf1 !important; 
-        color: #0c5460 !important; 
-        font-weight: bold !important;
-        border-radius: 5px !important;
-        padding: 5px 10px !important;
-    }
-    .insight-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        margin: 0.5rem 0;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-    }    .chart-container {
-        background: white;
-        padding: 1rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        margin: 0.5rem 0;
-    }
-    
-    .chat-message {
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 0.5rem 0;
-    }
-    .user-message {
-        background-color: #e3f2fd;
-        border-left: 4px solid #2196f3;
-    }
-    .assistant-message {
-        background-color: #f3e5f5;
-        border-left: 4px solid #9c27b0;
-    }
-    
-    /* Enhanced dataframe styling */
-    .dataframe {
-        border-radius: 10px;
-        overflow: hidden;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    /* Streamlit metric styling enhancement */
-    div[data-testid="metric-container"] {
-        background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-        border: 1px solid #e1e5e9;
-        padding: 1rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    div[data-testid="metric-container"] > div {
-        width: fit-content;
-        margin: auto;
-    }
-    div[data-testid="metric-container"] label {
-        width: fit-content;
-        margin: auto;
-    }
-                /* Add these inquiry-specific styles */
-    .inquiry-card {
-        background: #f8f9fa;
-        border: 1px solid #dee2e6;
-        border-radius: 8px;
-        padding: 1rem;
-        margin: 0.5rem 0;
-        border-left: 4px solid #007bff;
-    }
-    .inquiry-priority-high { border-left-color: #dc3545; }
-    .inquiry-priority-urgent { border-left-color: #fd7e14; }
-    .inquiry-priority-medium { border-left-color: #ffc107; }
-    .inquiry-priority-low { border-left-color: #28a745; }
-    
-    .inquiry-status-open { background-color: #fff3cd; }
-    .inquiry-status-in_review { background-color: #d1ecf1; }
-    .inquiry-status-responded { background-color: #d4edda; }
-    .inquiry-status-resolved { background-color: #d4edda; }
-    .inquiry-status-closed { background-color: #f8d7da; }
-    
-    .inquiry-button {
-        margin: 0.25rem;
-        padding: 0.375rem 0.75rem;
-        border-radius: 0.375rem;
-        border: 1px solid transparent;
-        font-size: 0.875rem;
-        font-weight: 500;
-        text-align: center;
-        cursor: pointer;
-        text-decoration: none;
-        display: inline-block;
-    }
-    .btn-create { 
-        background-color: #28a745; 
-        color: white; 
-        border-color: #28a745;
-    }
-    .btn-create:hover {
-        background-color: #218838;
-        border-color: #1e7e34;
-    }
-    .btn-view { 
-        background-color: #007bff; 
-        color: white;
-        border-color: #007bff;
-    }
-    .btn-view:hover {
-        background-color: #0069d9;
-        border-color: #0062cc;
-    }
-    .btn-edit { 
-        background-color: #ffc107; 
-        color: #212529;
-        border-color: #ffc107;
-    }
-    .btn-edit:hover {
-        background-color: #e0a800;
-        border-color: #d39e00;
-    }
-            /* Enhanced button styling for disabled state */
-    .stButton > button:disabled {
-        background-color: #e9ecef !important;
-        color: #6c757d !important;
-        border-color: #dee2e6 !important;
-        cursor: not-allowed !important;
-        opacity: 0.65 !important;
-    }
-    
-    .stButton > button:disabled:hover {
-        background-color: #e9ecef !important;
-        color: #6c757d !important;
-        border-color: #dee2e6 !important;
-        transform: none !important;
-    }
-    
-    /* Status indicator styling */
-    .inquiry-status-indicator {
-        font-size: 0.75rem;
-        font-style: italic;
-        color: #6c757d;
-        margin-top: 0.25rem;
-    }
-    
-    .inquiry-status-open {
-        color: #28a745;
-        font-weight: 500;
-    }
-    
-    .inquiry-status-none {
-        color: #6c757d;
-    }
-    
-    .inquiry-status-closed {
-        color: #dc3545;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS for enhanced dashboard styling, read from style.css once per process
+@st.cache_data
+def load_page_css() -> str:
+    """Load the dashboard CSS and reuse the markup string on every rerun"""
+    css_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "style.css")
+    with open(css_path, "r", encoding="utf-8") as f:
+        css = f.read()
+    # Strip comments and collapse whitespace once, so each rerun ships fewer bytes
+    css = re.sub(r"\s+", " ", re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)).strip()
+    return f"<style>{css}</style>"
+
+st.markdown(load_page_css(), unsafe_allow_html=True)
+
+# Start-up instructions shown while the MCP servers are unreachable
+MCP_START_HELP = """
+**Before using this dashboard, you need to start the MCP servers:**
+
+1. Open a terminal in the project root directory
+2. Run: `python start_mcp_servers.py`
+3. Wait for all three servers to start successfully
+4. Refresh this page
+
+**Alternative - Start individual servers:**
+```bash
+# Terminal 1 - Main RAG Server
+cd mcp-rag
+python -m fastmcp run main.py --port 8000
+
+# Terminal 2 - Web Search Server  
+cd mcp-websearch
+python -m fastmcp run main.py --port 8001
+
+```
+"""
 
 def main():
     """Main application function"""
@@ -610,51 +670,13 @@ def main():
         st.info("💡 **To start MCP servers:** Run `python start_mcp_servers.py` in the project root directory")
         # Server startup instructions
         with st.expander("🚀 How to start MCP servers"):
-            st.markdown("""
-            **Before using this dashboard, you need to start the MCP servers:**
-            
-            1. Open a terminal in the project root directory
-            2. Run: `python start_mcp_servers.py`
-            3. Wait for all three servers to start successfully
-            4. Refresh this page
-            
-            **Alternative - Start individual servers:**
-            ```bash
-            # Terminal 1 - Main RAG Server
-            cd mcp-rag
-            python -m fastmcp run main.py --port 8000
-            
-            # Terminal 2 - Web Search Server  
-            cd mcp-websearch
-            python -m fastmcp run main.py --port 8001
-            
-            ```
-            """)
+            st.markdown(MCP_START_HELP)
     elif server_status["status"] == "error":
         st.warning(f"⚠️ {server_status['message']}")
         st.info("💡 **Troubleshooting:** Check if servers are running with `python start_mcp_servers.py`")
         # Server startup instructions
         with st.expander("🚀 How to start MCP servers"):
-            st.markdown("""
-            **Before using this dashboard, you need to start the MCP servers:**
-            
-            1. Open a terminal in the project root directory
-            2. Run: `python start_mcp_servers.py`
-            3. Wait for all three servers to start successfully
-            4. Refresh this page
-            
-            **Alternative - Start individual servers:**
-            ```bash
-            # Terminal 1 - Main RAG Server
-            cd mcp-rag
-            python -m fastmcp run main.py --port 8000
-            
-            # Terminal 2 - Web Search Server  
-            cd mcp-websearch
-            python -m fastmcp run main.py --port 8001
-            
-            ```
-            """)
+            st.markdown(MCP_START_HELP)
     else:
         st.warning(f"⚠️ {server_status['message']} - Using sample data")
     
@@ -663,24 +685,23 @@ def main():
         st.header("Navigation")
         page = st.radio(
             "Select Page",
-            ["Dashboard", "RAG Assistant", "Search Events", "Process Workflow", "Analytics", "Administrator"]
+            list(PAGES)
         )# Server Status Sidebar
         st.header("🖥️ Server Status")
         
         # Use cached status instead of checking each server individually
         cached_status = check_server_status()
         
-        if cached_status["status"] == "connected":
-            st.success("🟢 All servers online")
-            
-            # Show simplified status without additional checks
-            st.write("**RAG Server:** 🟢")
-            st.write("**Web Search:** 🟢") 
+        if cached_status["status"] in ("connected", "disconnected"):
+            servers_up = cached_status.get("servers", {})
+            if cached_status["status"] == "connected":
+                st.success("🟢 All servers online")
+            else:
+                st.error("🔴 Servers offline")
             
-        elif cached_status["status"] == "disconnected":
-            st.error("🔴 Servers offline")
-            st.write("**RAG Server:** 🔴")
-            st.write("**Web Search:** 🔴")
+            # Per-server results come from the same cached health check
+            st.write(f"**RAG Server:** {'🟢' if servers_up.get('rag') else '🔴'}")
+            st.write(f"**Web Search:** {'🟢' if servers_up.get('websearch') else '🔴'}")
             
         elif cached_status["status"] == "error":
             st.warning("⚠️ Connection issues")
@@ -693,22 +714,10 @@ def main():
             
         # Add refresh button for manual status update
         if st.button("🔄 Refresh Status"):
-            if "server_status_cache" in st.session_state:
-                del st.session_state.server_status_cache
+            check_server_status.clear()
             st.rerun()
       # Route to selected page
-    if page == "Dashboard":
-        show_dashboard()
-    elif page == "RAG Assistant":
-        show_rag_assistant()
-    elif page == "Search Events":
-        show_search_events()
-    elif page == "Process Workflow":
-        show_process_workflow()
-    elif page == "Analytics":
-        show_analytics_page()  # Moved old dashboard content here
-    elif page == "Administrator":
-        show_administrator_page()  
+    PAGES[page]()
     
 # Inquiry Management Functions - Pure MCP Implementation
 def get_user_inquiry_status(event_id: str, user_id: str) -> Dict[str, Any]:
@@ -998,46 +1007,30 @@ def show_inquiry_modal_view(event_data: Dict[str, Any]):
         
         st.markdown("---")
         
-        # Display inquiries
-        for inquiry in filtered_inquiries:
-            with st.container():
+        # Display inquiries one page at a time as native bordered containers
+        page_count = max(1, -(-len(filtered_inquiries) // INQUIRIES_PER_PAGE))
+        page_number = 1
+        if page_count > 1:
+            page_number = st.number_input("Page", min_value=1, max_value=page_count, value=1, key="inquiry_view_page")
+        page_start = (page_number - 1) * INQUIRIES_PER_PAGE
+        
+        for inquiry in filtered_inquiries[page_start:page_start + INQUIRIES_PER_PAGE]:
+            with st.container(border=True):
                 # Color coding based on priority and status
-                priority_color = {
-                    "LOW": "#28a745", 
-                    "MEDIUM": "#ffc107", 
-                    "HIGH": "#fd7e14", 
-                    "URGENT": "#dc3545"
-                }.get(inquiry.get('priority', 'MEDIUM'), "#ffc107")
+                priority = inquiry.get('priority', 'N/A')
+                status = inquiry.get('status', 'N/A')
+                priority_color = INQUIRY_PRIORITY_COLORS.get(priority, "orange")
+                status_color = INQUIRY_STATUS_COLORS.get(status, "blue")
                 
-                status_color = {
-                    "OPEN": "#17a2b8",
-                    "ACKNOWLEDGED": "#6c757d", 
-                    "IN_REVIEW": "#007bff",
-                    "RESPONDED": "#28a745",
-                    "ESCALATED": "#dc3545",
-                    "RESOLVED": "#20c997",
-                    "CLOSED": "#6c757d"
-                }.get(inquiry.get('status', 'OPEN'), "#17a2b8")
-                
-                st.markdown(f"""
-                <div style="border-left: 4px solid {priority_color}; padding: 1rem; margin: 0.5rem 0; background: #f8f9fa; border-radius: 5px;">
-                    <h4>📋 {inquiry.get('subject', 'No Subject')}</h4>
-                    <p>
-                        <span style="background: {priority_color}; color: white; padding: 2px 8px; border-radius: 12px; font-size: 0.8em; font-weight: bold;">
-                            {inquiry.get('priority', 'N/A')}
-                        </span>
-                        <span style="background: {status_color}; color: white; padding: 2px 8px; border-radius: 12px; font-size: 0.8em; font-weight: bold; margin-left: 0.5rem;">
-                            {inquiry.get('status', 'N/A')}
-                        </span>
-                    </p>
-                    <p><strong>User:</strong> {inquiry.get('user_name', 'N/A')} ({inquiry.get('organization', 'N/A')})</p>
-                    <p><strong>Created:</strong> {inquiry.get('created_at', 'N/A')} | 
-                       <strong>Updated:</strong> {inquiry.get('updated_at', 'N/A')}</p>
-                    <p><strong>Description:</strong> {inquiry.get('description', 'N/A')}</p>
-                    {f"<p><strong>Response:</strong> {inquiry.get('response', '')}</p>" if inquiry.get('response') else ""}
-                    {f"<p><strong>Resolution Notes:</strong> {inquiry.get('resolution_notes', '')}</p>" if inquiry.get('resolution_notes') else ""}
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(f"#### 📋 {inquiry.get('subject', 'No Subject')}")
+                st.markdown(f":{priority_color}[**{priority}**] &nbsp; :{status_color}[**{status}**]")
+                st.markdown(f"**User:** {inquiry.get('user_name', 'N/A')} ({inquiry.get('organization', 'N/A')})")
+                st.caption(f"Created: {inquiry.get('created_at', 'N/A')} | Updated: {inquiry.get('updated_at', 'N/A')}")
+                st.markdown(f"**Description:** {inquiry.get('description', 'N/A')}")
+                if inquiry.get('response'):
+                    st.markdown(f"**Response:** {inquiry['response']}")
+                if inquiry.get('resolution_notes'):
+                    st.markdown(f"**Resolution Notes:** {inquiry['resolution_notes']}")
     else:
         st.info("No inquiries found for this corporate action")
     
@@ -1077,13 +1070,13 @@ def show_rag_assistant():
         rag_mode = "General RAG Search"
         st.info("🔄 Switched to General RAG mode (no subscriptions found)")
 
-    # Initialize chat history
+    # Initialize chat history, bounded so long sessions don't grow memory or rerun cost
     if "rag_chat_history" not in st.session_state:
-        st.session_state.rag_chat_history = []
+        st.session_state.rag_chat_history = deque(maxlen=CHAT_HISTORY_MAX_MESSAGES)
     
     # Initialize messages for backward compatibility
     if "messages" not in st.session_state:
-        st.session_state.messages = []
+        st.session_state.messages = deque(maxlen=CHAT_HISTORY_MAX_MESSAGES)
 
     # Display chat history with styled messages
     if st.session_state.rag_chat_history:
@@ -1125,7 +1118,7 @@ def show_rag_assistant():
                             msg.get("visualization_suggestions", {})
                         )
                         if fig:
-                            st.plotly_chart(fig, use_container_width=True, key=f"viz_{i}_{hash(str(msg))}")
+                            st.plotly_chart(fig, use_container_width=True, key=f"viz_{i}")
                 
                 # Show visualization suggestions if available
                 elif msg.get("visualization_suggestions"):
@@ -1154,8 +1147,8 @@ def show_rag_assistant():
         
         # Clear chat history button
         if st.button("🗑️ Clear Chat History"):
-            st.session_state.rag_chat_history = []
-            st.session_state.messages = []  # Clear old messages too
+            st.session_state.rag_chat_history.clear()
+            st.session_state.messages.clear()  # Clear old messages too
             st.rerun()
     
     else:
@@ -1200,7 +1193,8 @@ def show_rag_assistant():
                 if client:
                     # Prepare enhanced chat history (last 6 messages for context)
                     chat_history_for_context = []
-                    recent_messages = st.session_state.rag_chat_history[-6:] if len(st.session_state.rag_chat_history) > 6 else st.session_state.rag_chat_history
+                    history = st.session_state.rag_chat_history
+                    recent_messages = itertools.islice(history, max(len(history) - 6, 0), None)
                     
                     for msg in recent_messages:
                         if msg["role"] == "user":
@@ -1220,11 +1214,11 @@ def show_rag_assistant():
                       # Choose the appropriate RAG tool based on mode
                     if rag_mode == "General RAG Search":
                         # Use general RAG query that searches all corporate actions
-                        response = client.rag_query(
-                            query=user_input,
-                            max_results=5,
-                            chat_history=chat_history_for_context
-                        )
+                        response = fetch_cached(fetch_rag_answer, {
+                            "query": user_input,
+                            "max_results": 5,
+                            "chat_history": chat_history_for_context
+                        })
                     else:
                         # Use subscription-based RAG query
                         response = client._call_tool(
@@ -1234,12 +1228,12 @@ def show_rag_assistant():
                                 "query": user_input,
                                 "user_id": st.session_state.get('user_id', 'user_001'),
                                 "subscribed_symbols": st.session_state.get('user_subscriptions', []),
-                                "max_results": 5,                                "chat_history": json.dumps(chat_history_for_context) if chat_history_for_context else ""
+                                "max_results": 5,                                "chat_history": dumps_json(chat_history_for_context) if chat_history_for_context else ""
                             }
                         )
                     
                     if isinstance(response, str):
-                        rag_data = json.loads(response)
+                        rag_data = loads_json(response)
                     else:
                         rag_data = response
                     
@@ -1352,10 +1346,10 @@ def show_search_events():
                 # Remove empty parameters
                 search_params = {k: v for k, v in search_params.items() if v}
                 
-                response = client.search_corporate_actions(**search_params)
+                response = fetch_cached(fetch_search, search_params)
                 if "error" not in response:
                     if isinstance(response, str):
-                        search_results = json.loads(response)
+                        search_results = loads_json(response)
                     else:
                         search_results = response
                         
@@ -1372,9 +1366,12 @@ def show_search_events():
                         
                         # Calculate search result metrics
                         total_found = len(events)
-                        confirmed_events = len([e for e in events if e.get("status") == "confirmed"])
-                        announced_events = len([e for e in events if e.get("status") == "announced"])
-                        pending_events = len([e for e in events if e.get("status") == "pending"])
+                        # One pass each feeds the metrics, charts and insights below
+                        status_counts = Counter(e.get("status", "Unknown") for e in events)
+                        type_counts = Counter(e.get("event_type", "Unknown") for e in events)
+                        confirmed_events = status_counts["confirmed"]
+                        announced_events = status_counts["announced"]
+                        pending_events = status_counts["pending"]
                         
                         with col1:
                             st.metric("📋 Total Found", total_found)
@@ -1392,83 +1389,24 @@ def show_search_events():
                             with col1:
                                 # Status distribution for search results
                                 st.subheader("📊 Search Results - Status Distribution")
-                                status_counts = {}
-                                for event in events:
-                                    status = event.get("status", "Unknown")
-                                    status_counts[status] = status_counts.get(status, 0) + 1
-                                
                                 if status_counts:
-                                    fig_pie = px.pie(
-                                        values=list(status_counts.values()),
-                                        names=list(status_counts.keys()),
-                                        title="Results by Status",
-                                        color_discrete_map={
-                                            'confirmed': '#28a745',    # Green
-                                            'announced': '#ffc107',    # Yellow
-                                            'pending': '#dc3545',      # Red
-                                            'processed': '#17a2b8',    # Blue
-                                            'cancelled': '#6c757d'     # Gray
-                                        }
-                                    )
-                                    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+                                    fig_pie = build_status_pie(tuple(status_counts.items()), "Results by Status")
                                     st.plotly_chart(fig_pie, use_container_width=True)
                             
                             with col2:
                                 # Event type distribution for search results
                                 st.subheader("🏢 Search Results - Event Type Distribution")
-                                type_counts = {}
-                                for event in events:
-                                    event_type = event.get("event_type", "Unknown")
-                                    type_counts[event_type] = type_counts.get(event_type, 0) + 1
-                                
                                 if type_counts:
-                                    fig_bar = px.bar(
-                                        x=list(type_counts.keys()),
-                                        y=list(type_counts.values()),
-                                        title="Results by Event Type",
-                                        color=list(type_counts.values()),
-                                        color_continuous_scale="viridis"
-                                    )
-                                    fig_bar.update_layout(xaxis_title="Event Type", yaxis_title="Count")
+                                    fig_bar = build_type_bar(tuple(type_counts.items()), "Results by Event Type")
                                     st.plotly_chart(fig_bar, use_container_width=True)
                         
                         # Enhanced results table with color-coded status
                         st.subheader("📋 Search Results - Detailed View")
-                        df = pd.DataFrame(events)
+                        display_df = build_event_table(events)
                         
-                        # Format the dataframe for display with normalized column names
-                        display_columns = ["company_name", "symbol", "event_type", "status", "announcement_date"]
-                        available_columns = [col for col in display_columns if col in df.columns]
-                        
-                        if available_columns:
-                            display_df = df[available_columns].copy()
-                            
-                            # Add status styling function
-                            def color_status(val):
-                                if val == 'confirmed':
-                                    return 'background-color: #d4edda; color: #155724; font-weight: bold;'
-                                elif val == 'announced':
-                                    return 'background-color: #fff3cd; color: #856404; font-weight: bold;'
-                                elif val == 'pending':
-                                    return 'background-color: #f8d7da; color: #721c24; font-weight: bold;'
-                                elif val == 'processed':
-                                    return 'background-color: #d1ecf1; color: #0c5460; font-weight: bold;'
-                                else:
-                                    return 'background-color: #e2e3e5; color: #383d41; font-weight: bold;'
-                            
-                            # Rename columns for better display
-                            column_mapping = {
-                                "company_name": "Company",
-                                "symbol": "Symbol", 
-                                "event_type": "Event Type",
-                                "status": "Status",
-                                "announcement_date": "Announced"
-                            }
-                            display_df = display_df.rename(columns=column_mapping)
-                            
-                            # Apply styling
-                            styled_df = display_df.style.applymap(color_status, subset=['Status'])
-                            st.dataframe(styled_df, use_container_width=True)
+                        # Apply styling
+                        styled_df = display_df.style.apply(style_status_column, subset=['Status'])
+                        st.dataframe(styled_df, use_container_width=True)
                         
                         # Search insights
                         st.subheader("🔍 Search Insights")
@@ -1477,26 +1415,17 @@ def show_search_events():
                         
                         with col1:
                             # Most active companies in search results
-                            company_counts = {}
-                            for event in events:
-                                company = event.get("company_name", "Unknown")
-                                company_counts[company] = company_counts.get(company, 0) + 1
+                            company_counts = Counter(event.get("company_name", "Unknown") for event in events)
                             
                             if company_counts:
-                                most_active = max(company_counts, key=company_counts.get)
-                                st.metric("🏆 Most Active in Results", most_active, f"{company_counts[most_active]} events")
+                                most_active, most_active_count = company_counts.most_common(1)[0]
+                                st.metric("🏆 Most Active in Results", most_active, f"{most_active_count} events")
                         
                         with col2:
                             # Most common event type in search
-                            if len(events) > 0:
-                                type_counts = {}
-                                for event in events:
-                                    event_type = event.get("event_type", "Unknown")
-                                    type_counts[event_type] = type_counts.get(event_type, 0) + 1
-                                
-                                if type_counts:
-                                    most_common_type = max(type_counts, key=type_counts.get)
-                                    st.metric("📈 Most Common Type", most_common_type.replace('_', ' ').title(), f"{type_counts[most_common_type]} events")
+                            if type_counts:
+                                most_common_type, most_common_count = type_counts.most_common(1)[0]
+                                st.metric("📈 Most Common Type", most_common_type.replace('_', ' ').title(), f"{most_common_count} events")
                         
                         with col3:
                             # Date range of results
@@ -1517,19 +1446,22 @@ def show_search_events():
                         for i, event in enumerate(events):
                             # Use normalized company_name field
                             company_display = event.get('company_name', 'Unknown Company')
-                            status_emoji = {"confirmed": "✅", "announced": "📅", "pending": "⏳", "processed": "✅", "cancelled": "❌"}.get(event.get('status', ''), "❓")
+                            status_emoji = STATUS_EMOJI.get(event.get('status', ''), "❓")
                             
                             with st.expander(f"{status_emoji} {event.get('event_type', 'Unknown').replace('_', ' ').title()} - {company_display}"):
                                 col1, col2 = st.columns(2)
                                 
+                                # One markdown element per column keeps the widget tree small for long result lists
                                 with col1:
-                                    st.write(f"**Event ID:** {event.get('event_id', 'N/A')}")
-                                    st.write(f"**Symbol:** {event.get('symbol', 'N/A')}")
-                                    st.write(f"**Status:** {event.get('status', 'N/A')}")
-                                    st.write(f"**Announcement Date:** {event.get('announcement_date', 'N/A')}")
+                                    st.markdown(
+                                        f"**Event ID:** {event.get('event_id', 'N/A')}  \n"
+                                        f"**Symbol:** {event.get('symbol', 'N/A')}  \n"
+                                        f"**Status:** {event.get('status', 'N/A')}  \n"
+                                        f"**Announcement Date:** {event.get('announcement_date', 'N/A')}"
+                                    )
                                 
                                 with col2:
-                                    st.write(f"**Description:** {event.get('description', 'N/A')}")
+                                    st.markdown(f"**Description:** {event.get('description', 'N/A')}")
                                     if event.get('event_details'):
                                         st.write("**Event Details:**")
                                         st.json(event['event_details'])
@@ -1561,11 +1493,11 @@ def show_web_research():
             if query:
                 try:
                     if client:
-                        response = client.web_search(query, result_count=10)
+                        response = fetch_cached(fetch_web_search, {"query": query, "result_count": 10})
                         
                         if "error" not in response:
                             if isinstance(response, str):
-                                search_data = json.loads(response)
+                                search_data = loads_json(response)
                             else:
                                 search_data = response
                                 
@@ -1595,11 +1527,11 @@ def show_web_research():
             if news_query:
                 try:
                     if client:
-                        response = client.news_search(news_query, result_count=10)
+                        response = fetch_cached(fetch_news_search, {"query": news_query, "result_count": 10})
                         
                         if "error" not in response:
                             if isinstance(response, str):
-                                news_data = json.loads(response)
+                                news_data = loads_json(response)
                             else:
                                 news_data = response
                                 
@@ -1628,11 +1560,11 @@ def show_web_research():
             if symbol:
                 try:
                     if client:
-                        response = client.financial_data_search(symbol, data_type="overview")
+                        response = fetch_cached(fetch_financial_data, {"symbol": symbol, "data_type": "overview"})
                         
                         if "error" not in response:
                             if isinstance(response, str):
-                                financial_data = json.loads(response)
+                                financial_data = loads_json(response)
                             else:
                                 financial_data = response
                                 
@@ -1654,6 +1586,8 @@ def show_web_research():
 
 def show_sample_dashboard():
     """Show enhanced sample dashboard when MCP servers are unavailable"""
+    import pandas as pd
+    import plotly.express as px
     st.info("🔧 Showing sample data - MCP servers may be offline")
     
     events = get_sample_upcoming_events()
@@ -1707,17 +1641,8 @@ def show_sample_dashboard():
     st.subheader("📋 Recent Corporate Actions")
     df = pd.DataFrame(events)
     
-    # Add status styling function
-    def color_status(val):
-        if val == 'confirmed':
-            return 'background-color: #d4edda; color: #155724; font-weight: bold;'
-        elif val == 'announced':
-            return 'background-color: #fff3cd; color: #856404; font-weight: bold;'
-        else:
-            return 'font-weight: bold;'
-    
     # Apply styling
-    styled_df = df.style.applymap(color_status, subset=['status'])
+    styled_df = df.style.apply(style_status_column, subset=['status'])
     st.dataframe(styled_df, use_container_width=True)
     
     # Sample insights
@@ -1774,6 +1699,61 @@ def normalize_event_data(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     
     return normalized_events
 
+@functools.lru_cache(maxsize=512)
+def _parse_details_json(details: str) -> Any:
+    """Parse an event_details string once; the same strings recur on every chart rerun"""
+    try:
+        return loads_json(details)
+    except json.JSONDecodeError:
+        return {}
+
+def parse_event_details(details: Any) -> Dict[str, Any]:
+    """Parse an event_details value that may arrive as a JSON string (treat the result as read-only)"""
+    if isinstance(details, str):
+        details = _parse_details_json(details)
+    return details if isinstance(details, dict) else {}
+
+# Pie slice colors for event statuses
+STATUS_PIE_COLORS = {
+    'confirmed': '#28a745',    # Green
+    'announced': '#ffc107',    # Yellow
+    'pending': '#dc3545',      # Red
+    'processed': '#17a2b8',    # Blue
+    'cancelled': '#6c757d'     # Gray
+}
+
+# Bound cached chart figures: each distinct counts tuple would otherwise be kept for the process lifetime
+FIGURE_CACHE_TTL = 600  # seconds
+FIGURE_CACHE_MAX_ENTRIES = 32
+
+@st.cache_resource(ttl=FIGURE_CACHE_TTL, max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def build_status_pie(status_counts: tuple, title: str):
+    """Build the status distribution pie chart for a tuple of (status, count) pairs"""
+    import plotly.express as px
+    fig = px.pie(
+        values=[count for _, count in status_counts],
+        names=[status for status, _ in status_counts],
+        title=title,
+        color_discrete_map=STATUS_PIE_COLORS
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+@st.cache_resource(ttl=FIGURE_CACHE_TTL, max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def build_type_bar(type_counts: tuple, title: str):
+    """Build the event type distribution bar chart for a tuple of (event_type, count) pairs"""
+    import plotly.express as px
+    counts = [count for _, count in type_counts]
+    fig = px.bar(
+        x=[event_type for event_type, _ in type_counts],
+        y=counts,
+        title=title,
+        color=counts,
+        color_continuous_scale="viridis"
+    )
+    fig.update_layout(xaxis_title="Event Type", yaxis_title="Count")
+    return fig
+
 def generate_dynamic_visualization(sources: List[Dict[str, Any]], query: str, viz_suggestions: Dict[str, Any]) -> Optional[object]:
     """
     Dynamically generate visualizations based on corporate actions data and user query.
@@ -1786,71 +1766,71 @@ def generate_dynamic_visualization(sources: List[Dict[str, Any]], query: str, vi
     Returns:
         Plotly figure object or None if generation fails
     """
+    import pandas as pd
+    import plotly.express as px
     try:
         if not sources:
             return None
             
         # Normalize the data to handle different field structures
         normalized_data = normalize_event_data(sources)
-        df = pd.DataFrame(normalized_data)
         
-        if df.empty:
-            return None
-            
         query_lower = query.lower()
         recommended_charts = viz_suggestions.get("recommended_charts", [])
         
-        # Determine the best visualization based on query and data
+        # Count charts read the normalized records directly; only the timeline,
+        # dividend and summary charts need a DataFrame
         if any(word in query_lower for word in ["status", "distribution", "breakdown"]):
             # Status distribution pie chart
-            if "status" in df.columns:
-                status_counts = df['status'].value_counts()
-                fig = px.pie(
-                    values=status_counts.values,
-                    names=status_counts.index,
-                    title=f"Corporate Action Status Distribution ({len(df)} events)",
-                    color_discrete_map={
-                        'confirmed': '#28a745',
-                        'announced': '#ffc107', 
-                        'pending': '#dc3545',
-                        'processed': '#17a2b8',
-                        'cancelled': '#6c757d'
-                    }
-                )
-                fig.update_traces(textposition='inside', textinfo='percent+label')
-                return fig
+            status_counts = Counter(
+                event['status'] for event in normalized_data if event['status'] is not None
+            ).most_common()
+            fig = px.pie(
+                values=[count for _, count in status_counts],
+                names=[status for status, _ in status_counts],
+                title=f"Corporate Action Status Distribution ({len(normalized_data)} events)",
+                color_discrete_map=STATUS_PIE_COLORS
+            )
+            fig.update_traces(textposition='inside', textinfo='percent+label')
+            return fig
                 
         elif any(word in query_lower for word in ["type", "types", "event type", "category"]):
             # Event type bar chart
-            if "event_type" in df.columns:
-                type_counts = df['event_type'].value_counts()
-                fig = px.bar(
-                    x=type_counts.index,
-                    y=type_counts.values,
-                    title=f"Event Types Distribution ({len(df)} events)",
-                    labels={'x': 'Event Type', 'y': 'Count'},
-                    color=type_counts.values,
-                    color_continuous_scale="viridis"
-                )
-                fig.update_layout(xaxis_title="Event Type", yaxis_title="Count")
-                return fig
+            type_counts = Counter(
+                event['event_type'] for event in normalized_data if event['event_type'] is not None
+            ).most_common()
+            counts = [count for _, count in type_counts]
+            fig = px.bar(
+                x=[event_type for event_type, _ in type_counts],
+                y=counts,
+                title=f"Event Types Distribution ({len(normalized_data)} events)",
+                labels={'x': 'Event Type', 'y': 'Count'},
+                color=counts,
+                color_continuous_scale="viridis"
+            )
+            fig.update_layout(xaxis_title="Event Type", yaxis_title="Count")
+            return fig
                 
         elif any(word in query_lower for word in ["company", "companies", "issuer", "most active"]):
             # Company activity chart
-            if "company_name" in df.columns:
-                company_counts = df['company_name'].value_counts().head(10)
-                fig = px.bar(
-                    x=company_counts.values,
-                    y=company_counts.index,
-                    orientation='h',
-                    title=f"Most Active Companies ({len(df)} total events)",
-                    labels={'x': 'Number of Events', 'y': 'Company'},
-                    color=company_counts.values,
-                    color_continuous_scale="blues"
-                )
-                return fig
-                
-        elif any(word in query_lower for word in ["timeline", "over time", "trend", "date", "when"]):
+            company_counts = Counter(
+                event['company_name'] for event in normalized_data if event['company_name'] is not None
+            ).most_common(10)
+            counts = [count for _, count in company_counts]
+            fig = px.bar(
+                x=counts,
+                y=[company for company, _ in company_counts],
+                orientation='h',
+                title=f"Most Active Companies ({len(normalized_data)} total events)",
+                labels={'x': 'Number of Events', 'y': 'Company'},
+                color=counts,
+                color_continuous_scale="blues"
+            )
+            return fig
+        
+        df = pd.DataFrame(normalized_data)
+        
+        if any(word in query_lower for word in ["timeline", "over time", "trend", "date", "when"]):
             # Timeline visualization
             if "announcement_date" in df.columns:
                 df['announcement_date'] = pd.to_datetime(df['announcement_date'], errors='coerce')
@@ -1876,21 +1856,18 @@ def generate_dynamic_visualization(sources: List[Dict[str, Any]], query: str, vi
             dividend_events = df[df['event_type'] == 'dividend'] if 'event_type' in df.columns else df
             
             if not dividend_events.empty and 'event_details' in dividend_events.columns:
-                amounts = []
-                companies = []
+                # Pull amounts out column-wise instead of building a Series per row with iterrows
+                details = dividend_events['event_details'].map(parse_event_details)
+                amount_series = pd.to_numeric(
+                    details.map(lambda d: d.get('dividend_amount', 0)), errors='coerce'
+                )
+                has_amount = (amount_series > 0).to_numpy()
                 
-                for _, row in dividend_events.iterrows():
-                    details = row.get('event_details', {})
-                    if isinstance(details, str):
-                        try:
-                            details = json.loads(details)
-                        except:
-                            details = {}
-                    
-                    amount = details.get('dividend_amount', 0)
-                    if amount and amount > 0:
-                        amounts.append(amount)
-                        companies.append(row.get('company_name', 'Unknown'))
+                amounts = amount_series[has_amount].tolist()
+                if 'company_name' in dividend_events.columns:
+                    companies = dividend_events['company_name'][has_amount].fillna('Unknown').tolist()
+                else:
+                    companies = ['Unknown'] * len(amounts)
                 
                 if amounts:
                     fig = px.bar(
@@ -1911,8 +1888,10 @@ def generate_dynamic_visualization(sources: List[Dict[str, Any]], query: str, vi
         st.error(f"Error generating visualization: {str(e)}")
         return None
 
-def create_summary_visualization(df: pd.DataFrame) -> Optional[object]:
+def create_summary_visualization(df: "pd.DataFrame") -> Optional[object]:
     """Create a summary visualization with multiple subplots"""
+    import pandas as pd
+    import plotly.graph_objects as go
     try:
         from plotly.subplots import make_subplots
         
@@ -1987,6 +1966,10 @@ def execute_dynamic_code(code: str, data: Dict[str, Any]) -> Any:
     Returns:
         Result of code execution or None if failed
     """
+    import io
+    import pandas as pd
+    import plotly.express as px
+    import plotly.graph_objects as go
     try:
         # Create a safe execution environment
         safe_globals = {
@@ -2051,17 +2034,17 @@ def show_dashboard():
             show_inquiry_modal_edit(event_data)
             return
 
-    # Load subscriptions from database on first load
+    # Load subscriptions from database on first load, fetching upcoming events alongside
+    upcoming_result = None
     if not st.session_state.subscriptions_loaded and client:
         try:
-            result = client._call_tool(
-                MCP_SERVERS["rag"], 
-                "get_subscription_tool",
-                {"user_id": st.session_state.user_id}
-            )
+            result, upcoming_result = client._call_tools([
+                (MCP_SERVERS["rag"], "get_subscription_tool", {"user_id": st.session_state.user_id}),
+                (MCP_SERVERS["rag"], "get_upcoming_events_tool", {"user_id": st.session_state.user_id, "days_ahead": 7})
+            ])
             
             if isinstance(result, str):
-                result = json.loads(result)
+                result = loads_json(result)
             
             if isinstance(result, dict) and result.get("subscription"):
                 subscription = result["subscription"]
@@ -2128,7 +2111,8 @@ def show_dashboard():
                         st.warning(f"✅ Subscribed to: {', '.join(symbols)} (Session only - {str(e)})")
                 else:
                     st.success(f"✅ Subscribed to: {', '.join(symbols)} (Session only)")
-                st.rerun()
+                # The subscription list and upcoming events below already render the update
+                # in this run, so no st.rerun() (which also discarded the status message)
     
     # Display current subscriptions
     if st.session_state.user_subscriptions:
@@ -2178,8 +2162,8 @@ def show_dashboard():
         filtered_events = []
         if client and st.session_state.user_subscriptions:
             try:
-                # Use the get_upcoming_events_tool from MCP server
-                result = client._call_tool(
+                # Use the get_upcoming_events_tool from MCP server, unless it was fetched with the subscriptions
+                result = upcoming_result if upcoming_result is not None else client._call_tool(
                     MCP_SERVERS["rag"], 
                     "get_upcoming_events_tool",
                     {"user_id": st.session_state.user_id, "days_ahead": 7}
@@ -2187,7 +2171,7 @@ def show_dashboard():
                 
                 #print(f"🔍 MCP Tool Result: {result}")
                 if isinstance(result, str):
-                    result = json.loads(result)
+                    result = loads_json(result)
                     mcp_events = result.get("upcoming_events", [])
                 elif isinstance(result, dict) and result.get("upcoming_events"):
                     mcp_events = result["upcoming_events"]
@@ -2411,47 +2395,46 @@ def show_dashboard():
         st.error(f"❌ Error loading upcoming actions: {str(e)}")
         st.info("📊 Using sample data for demonstration")
 
-def get_sample_upcoming_events(subscribed_symbols=None):
-    """Get sample upcoming events for the next week"""
-    from datetime import timedelta
+SAMPLE_COMPANIES = (
+    ("AAPL", "Apple Inc."),
+    ("MSFT", "Microsoft Corporation"),
+    ("GOOGL", "Alphabet Inc."),
+    ("TSLA", "Tesla Inc."),
+    ("AMZN", "Amazon.com Inc."),
+    ("META", "Meta Platforms Inc."),
+    ("NVDA", "NVIDIA Corporation"),
+    ("BRK.A", "Berkshire Hathaway Inc."),
+    ("JPM", "JPMorgan Chase & Co."),
+    ("JNJ", "Johnson & Johnson"),
+)
+SAMPLE_EVENT_TYPES = ("dividend", "stock_split", "special_dividend", "rights_offering")
+SAMPLE_EVENT_STATUSES = ("announced", "confirmed", "pending")
+
+@functools.lru_cache(maxsize=1)
+def _build_sample_upcoming_events(day: str) -> tuple:
+    """Build the sample week of events once per calendar day"""
     import random
     
-    # Base events happening in the next 7 days
-    today = datetime.now()
+    today = datetime.strptime(day, '%Y-%m-%d')
     sample_events = []
     
-    companies = [
-        {"symbol": "AAPL", "company_name": "Apple Inc."},
-        {"symbol": "MSFT", "company_name": "Microsoft Corporation"},
-        {"symbol": "GOOGL", "company_name": "Alphabet Inc."},
-        {"symbol": "TSLA", "company_name": "Tesla Inc."},
-        {"symbol": "AMZN", "company_name": "Amazon.com Inc."},
-        {"symbol": "META", "company_name": "Meta Platforms Inc."},
-        {"symbol": "NVDA", "company_name": "NVIDIA Corporation"},
-        {"symbol": "BRK.A", "company_name": "Berkshire Hathaway Inc."},
-        {"symbol": "JPM", "company_name": "JPMorgan Chase & Co."},
-        {"symbol": "JNJ", "company_name": "Johnson & Johnson"}
-    ]
-    
-    event_types = ["dividend", "stock_split", "special_dividend", "rights_offering"]
-    statuses = ["announced", "confirmed", "pending"]
-    
-    for i, company in enumerate(companies):
+    for symbol, company_name in SAMPLE_COMPANIES:
         # Create 1-2 events per company for upcoming week
         num_events = random.randint(1, 2)
         for j in range(num_events):
             event_date = today + timedelta(days=random.randint(1, 7))
-            event_type = random.choice(event_types)
+            event_type = random.choice(SAMPLE_EVENT_TYPES)
             
             event = {
-                "event_id": f"{company['symbol']}_EVT_{event_date.strftime('%Y%m%d')}_{j+1}",
-                "symbol": company["symbol"],
-                "company_name": company["company_name"],
+                "event_id": f"{symbol}_EVT_{event_date.strftime('%Y%m%d')}_{j+1}",
+                "symbol": symbol,
+                "company_name": company_name,
                 "event_type": event_type,
-                "status": random.choice(statuses),
-                "announcement_date": (today - timedelta(days=random.randint(1, 5))).strftime('%Y-%m-%d'),                "event_date": event_date.strftime('%Y-%m-%d'),
+                "status": random.choice(SAMPLE_EVENT_STATUSES),
+                "announcement_date": (today - timedelta(days=random.randint(1, 5))).strftime('%Y-%m-%d'),
+                "event_date": event_date.strftime('%Y-%m-%d'),
                 "record_date": (event_date - timedelta(days=2)).strftime('%Y-%m-%d'),
-                "description": f"{event_type.replace('_', ' ').title()} for {company['company_name']}",
+                "description": f"{event_type.replace('_', ' ').title()} for {company_name}",
                 "details": {
                     "amount": f"${random.uniform(0.5, 3.0):.2f}" if "dividend" in event_type else None,
                     "ratio": f"{random.randint(2, 5)}:1" if "split" in event_type else None
@@ -2459,14 +2442,20 @@ def get_sample_upcoming_events(subscribed_symbols=None):
             }
             sample_events.append(event)
     
+    # Sort by event date
+    sample_events.sort(key=lambda x: x['event_date'])
+    return tuple(sample_events)
+
+def get_sample_upcoming_events(subscribed_symbols=None):
+    """Get sample upcoming events for the next week"""
+    sample_events = _build_sample_upcoming_events(datetime.now().strftime('%Y-%m-%d'))
+    
     # Filter by subscribed symbols if provided
     if subscribed_symbols:
         sample_events = [e for e in sample_events if e.get('symbol') in subscribed_symbols]
     
-    # Sort by event date
-    sample_events.sort(key=lambda x: x.get('event_date', today.strftime('%Y-%m-%d')))
-    
-    return sample_events
+    # Callers may annotate events, so hand out copies of the cached data
+    return copy.deepcopy(list(sample_events))
 
 def get_sample_inquiries(events):
     """Generate sample inquiries for events"""
@@ -2513,7 +2502,7 @@ def show_process_workflow():
             )
             
             if isinstance(result, str):
-                result = json.loads(result)
+                result = loads_json(result)
                 mcp_events = result.get("upcoming_events", [])
             elif isinstance(result, dict) and result.get("upcoming_events"):
                 mcp_events = result["upcoming_events"]
@@ -2585,7 +2574,7 @@ def show_process_workflow():
                             )
                             
                             if isinstance(result, str):
-                                result = json.loads(result)
+                                result = loads_json(result)
                             
                             if isinstance(result, dict) and result.get("success", False):
                                 st.success("✅ Inquiry created and saved to database!")
@@ -2714,28 +2703,39 @@ def show_analytics_page():
     """Renamed from old dashboard - now the analytics page"""
     st.header("📊 Analytics & Insights")
     
+    if st.button("🔄 Refresh Analytics Data"):
+        fetch_analytics_events.clear()
+    
     try:
         if client:
             # Fetch recent events using MCP client
-            events_response = client.search_corporate_actions(limit=1000)
+            events_response = fetch_cached(fetch_analytics_events, {"limit": 1000})
             if "error" not in events_response:
                 events = events_response.get("events", [])
                 st.success("✅ Connected to MCP servers - showing live data")
             else:
-                events = get_sample_upcoming_events()
+                events = normalize_event_data(get_sample_upcoming_events())
                 st.info("📊 Using sample data - MCP search failed")
         else:
-            events = get_sample_upcoming_events()
+            events = normalize_event_data(get_sample_upcoming_events())
             st.info("📊 Using sample data - MCP client not available")
-            
-        # Normalize event data to handle different structures
-        events = normalize_event_data(events)
         
-        # Calculate metrics
+        # Calculate every count from a single pass over the events
         total_events = len(events)
-        active_events = len([e for e in events if e.get("status", "").upper() == "CONFIRMED"])
-        upcoming_events = len([e for e in events if e.get("status", "").upper() == "ANNOUNCED"])
-        pending_events = len([e for e in events if e.get("status", "").upper() == "PENDING"])
+        status_counts, type_counts, company_counts = Counter(), Counter(), Counter()
+        recent_events = 0
+        for event in events:
+            status_counts[event.get("status", "Unknown")] += 1
+            type_counts[event.get("event_type", "Unknown")] += 1
+            company_counts[event.get("company_name", "Unknown")] += 1
+            if str(event.get("announcement_date") or "").startswith("2024"):
+                recent_events += 1
+        metric_counts = Counter()
+        for status, count in status_counts.items():
+            metric_counts[(status or "").upper()] += count
+        active_events = metric_counts["CONFIRMED"]
+        upcoming_events = metric_counts["ANNOUNCED"]
+        pending_events = metric_counts["PENDING"]
 
         # Display metrics with color indicators
         col1, col2, col3, col4 = st.columns(4)
@@ -2755,87 +2755,26 @@ def show_analytics_page():
             with col1:
                 # Status distribution pie chart
                 st.subheader("📊 Event Status Distribution")
-                status_counts = {}
-                for event in events:
-                    status = event.get("status", "Unknown")
-                    status_counts[status] = status_counts.get(status, 0) + 1
-                
                 if status_counts:
-                    fig_pie = px.pie(
-                        values=list(status_counts.values()),
-                        names=list(status_counts.keys()),
-                        title="Events by Status",
-                        color_discrete_map={
-                            'confirmed': '#28a745',    # Green
-                            'announced': '#ffc107',    # Yellow
-                            'pending': '#dc3545',      # Red
-                            'processed': '#17a2b8',    # Blue
-                            'cancelled': '#6c757d'     # Gray
-                        }
-                    )
-                    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+                    fig_pie = build_status_pie(tuple(status_counts.items()), "Events by Status")
                     st.plotly_chart(fig_pie, use_container_width=True)
             
             with col2:
                 # Event type distribution
                 st.subheader("🏢 Event Type Distribution")
-                type_counts = {}
-                for event in events:
-                    event_type = event.get("event_type", "Unknown")
-                    type_counts[event_type] = type_counts.get(event_type, 0) + 1
-                
                 if type_counts:
-                    fig_bar = px.bar(
-                        x=list(type_counts.keys()),
-                        y=list(type_counts.values()),
-                        title="Events by Type",
-                        color=list(type_counts.values()),
-                        color_continuous_scale="viridis"
-                    )
-                    fig_bar.update_layout(xaxis_title="Event Type", yaxis_title="Count")
+                    fig_bar = build_type_bar(tuple(type_counts.items()), "Events by Type")
                     st.plotly_chart(fig_bar, use_container_width=True)
         
         # Recent events table with color-coded status
         st.subheader("📋 Recent Corporate Actions")
         if events:
             # Create a styled dataframe
-            df = pd.DataFrame(events)
+            display_df = build_event_table(events)
             
-            # Format the dataframe for display with normalized column names
-            display_columns = ["company_name", "symbol", "event_type", "status", "announcement_date"]
-            available_columns = [col for col in display_columns if col in df.columns]
-            
-            if available_columns:
-                display_df = df[available_columns].copy()
-                
-                # Add status styling function
-                def color_status(val):
-                    if val == 'confirmed':
-                        return 'background-color: #d4edda; color: #155724; font-weight: bold;'
-                    elif val == 'announced':
-                        return 'background-color: #fff3cd; color: #856404; font-weight: bold;'
-                    elif val == 'pending':
-                        return 'background-color: #f8d7da; color: #721c24; font-weight: bold;'
-                    elif val == 'processed':
-                        return 'background-color: #d1ecf1; color: #0c5460; font-weight: bold;'
-                    else:
-                        return 'background-color: #e2e3e5; color: #383d41; font-weight: bold;'
-                
-                # Rename columns for better display
-                column_mapping = {
-                    "company_name": "Company",
-                    "symbol": "Symbol", 
-                    "event_type": "Event Type",
-                    "status": "Status",
-                    "announcement_date": "Announced"
-                }
-                display_df = display_df.rename(columns=column_mapping)
-                
-                # Apply styling
-                styled_df = display_df.style.applymap(color_status, subset=['Status'])
-                st.dataframe(styled_df, use_container_width=True)
-            else:
-                st.dataframe(df, use_container_width=True)
+            # Apply styling
+            styled_df = display_df.style.apply(style_status_column, subset=['Status'])
+            st.dataframe(styled_df, use_container_width=True)
                 
             # Additional insights
             st.subheader("🔍 Quick Insights")
@@ -2844,14 +2783,9 @@ def show_analytics_page():
             
             with col1:
                 # Most active companies
-                company_counts = {}
-                for event in events:
-                    company = event.get("company_name", "Unknown")
-                    company_counts[company] = company_counts.get(company, 0) + 1
-                
                 if company_counts:
-                    most_active = max(company_counts, key=company_counts.get)
-                    st.metric("🏆 Most Active Company", most_active, f"{company_counts[most_active]} events")
+                    most_active, most_active_count = company_counts.most_common(1)[0]
+                    st.metric("🏆 Most Active Company", most_active, f"{most_active_count} events")
             
             with col2:
                 # Most common event type
@@ -2861,7 +2795,6 @@ def show_analytics_page():
             
             with col3:
                 # Event timeline
-                recent_events = len([e for e in events if e.get("announcement_date", "").startswith("2024")])
                 st.metric("📅 Recent Events (2024)", recent_events, "events")
                 
         else:
@@ -2898,7 +2831,7 @@ def show_administrator_page():
             )
             
             if isinstance(result, str):
-                result = json.loads(result)
+                result = loads_json(result)
                 mcp_events = result.get("upcoming_events", [])
             elif isinstance(result, dict) and result.get("upcoming_events"):
                 mcp_events = result["upcoming_events"]
@@ -2972,7 +2905,7 @@ def show_administrator_page():
                         
                         if isinstance(result, str):
                             try:
-                                result = json.loads(result)
+                                result = loads_json(result)
                             except json.JSONDecodeError:
                                 st.error(f"Failed to parse response: {result}")
                                 return
@@ -3023,7 +2956,7 @@ def show_administrator_page():
                         
                         if isinstance(result, str):
                             try:
-                                result = json.loads(result)
+                                result = loads_json(result)
                             except json.JSONDecodeError:
                                 st.error(f"Failed to parse response: {result}")
                                 return
@@ -3127,5 +3060,15 @@ def show_administrator_page():
                     if st.button(f"📧 Send Notification", key=f"notify_{inquiry.get('inquiry_id')}"):
                         st.success(f"🔔 Notification sent to {inquiry.get('user_name')}!")
 
+# Sidebar pages in display order, mapped to their render functions
+PAGES = {
+    "Dashboard": show_dashboard,
+    "RAG Assistant": show_rag_assistant,
+    "Search Events": show_search_events,
+    "Process Workflow": show_process_workflow,
+    "Analytics": show_analytics_page,  # Moved old dashboard content here
+    "Administrator": show_administrator_page
+}
+
 if __name__ == "__main__":
     main()
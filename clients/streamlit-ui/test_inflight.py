@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for coalescing of in-flight MCP tool calls in SimpleMCPClient
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("mcp")
+
+import app
+
+
+def _client_without_loop():
+    """Build a SimpleMCPClient with only the state _call_tool needs (no background loop)"""
+    client = app.SimpleMCPClient.__new__(app.SimpleMCPClient)
+    client._loop = None
+    client._inflight = {}
+    client._inflight_lock = threading.Lock()
+    return client
+
+
+def test_call_tool_with_already_finished_future(monkeypatch):
+    """A call whose future is done before the callback is registered must not deadlock"""
+    def finished_future(coro, loop):
+        coro.close()
+        future = concurrent.futures.Future()
+        future.set_result({"ok": True})
+        return future
+
+    monkeypatch.setattr(asyncio, "run_coroutine_threadsafe", finished_future)
+    client = _client_without_loop()
+    tool_name = next(iter(app.COALESCED_TOOLS))
+    results = []
+
+    def call():
+        results.append(client._call_tool("http://mcp.test/mcp", tool_name, {"limit": 1}, timeout=1))
+
+    for _ in range(2):
+        worker = threading.Thread(target=call, daemon=True)
+        worker.start()
+        worker.join(timeout=5)
+        assert not worker.is_alive(), "_call_tool deadlocked on _inflight_lock"
+
+    assert results == [{"ok": True}, {"ok": True}]
+    assert client._inflight == {}